@@ -1,6 +1,7 @@
-from enum import Enum
+from enum import Enum, IntEnum
 import random
 import math
+import struct
 import pygame
 from typing import List, Tuple, Optional
 
@@ -11,33 +12,117 @@ class EnemyType(Enum):
     BAT = 4       # Fast-moving but weak flying enemy
     SPIDER = 5    # Lurks on walls, drops on player
 
-class EnemyBehavior(Enum):
+class EnemyBehavior(IntEnum):
     IDLE = 1       # Stays in place
     PATROL = 2     # Moves back and forth in an area
     AGGRESSIVE = 3 # Actively seeks the player
     LURK = 4       # Hides until player is close
     FLEE = 5       # Runs away when hurt
 
+# Behavior ids bound at module scope so hot-path checks skip the enum class lookup
+_IDLE, _PATROL, _AGGRESSIVE, _LURK, _FLEE = EnemyBehavior
+
+# Base stats per enemy type: (texture name, speed, damage, default behavior)
+ENEMY_STATS = {
+    EnemyType.SLIME: ("slime", 1, 5, EnemyBehavior.PATROL),
+    EnemyType.SKELETON: ("skeleton", 2, 8, EnemyBehavior.AGGRESSIVE),
+    EnemyType.GOBLIN: ("goblin", 3, 10, EnemyBehavior.AGGRESSIVE),
+    EnemyType.BAT: ("bat", 4, 3, EnemyBehavior.PATROL),
+    EnemyType.SPIDER: ("spider", 2, 7, EnemyBehavior.LURK),
+}
+DEFAULT_ENEMY_STATS = ("slime", 1, 5, EnemyBehavior.IDLE)
+
+# Health bar appearance
+HEALTH_BAR_BG_COLOR = (255, 0, 0)
+HEALTH_BAR_FG_COLOR = (0, 255, 0)
+HEALTH_BAR_HEIGHT = 3
+HEALTH_BAR_OFFSET = 5  # Pixels above the enemy's top edge
+
+# Semi-transparent red hit-flash overlays, one per texture size
+HIT_OVERLAY_COLOR = (255, 0, 0, 128)
+_hit_overlays = {}
+
+def get_hit_overlay(size: Tuple[int, int]) -> pygame.Surface:
+    """Get the shared red hit-flash overlay for a texture size, creating it once"""
+    overlay = _hit_overlays.get(size)
+    if overlay is None:
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill(HIT_OVERLAY_COLOR)
+        _hit_overlays[size] = overlay
+    return overlay
+
+# Per-texture draw variants: texture name -> (base surface, (normal, flipped, hit, hit flipped))
+_texture_variants = {}
+
+def get_texture_variants(texture_name: str, texture_getter) -> Tuple[pygame.Surface, ...]:
+    """Get the normal, flipped, hit and hit-flipped surfaces for a texture, building them once"""
+    base_texture = texture_getter(texture_name)
+    cached = _texture_variants.get(texture_name)
+    if cached is not None and cached[0] is base_texture:
+        return cached[1]
+    
+    # Flash red when hit
+    hit_texture = base_texture.copy()
+    hit_texture.blit(get_hit_overlay(hit_texture.get_size()), (0, 0))
+    
+    variants = (
+        base_texture,
+        pygame.transform.flip(base_texture, True, False),
+        hit_texture,
+        pygame.transform.flip(hit_texture, True, False),
+    )
+    _texture_variants[texture_name] = (base_texture, variants)
+    return variants
+
+PATROL_ARRIVE_DIST_SQ = 10 * 10  # Squared distance at which a patrol point counts as reached
+
+# Direction tables for random walking; shared so no list is built per call
+_ORTHO_DIRS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_IDLE_DIRS = _ORTHO_DIRS + ((0, 0),)  # Idle enemies may also stand still
+
+# Bound once so the per-frame idle roll skips the module attribute lookup
+_random = random.random
+_choice = random.choice
+
+def scale_to_speed(dx: float, dy: float, dist_sq: float, speed: int) -> Tuple[float, float]:
+    """Scale a direction vector with squared length dist_sq to the given speed"""
+    if dist_sq > 0:
+        # Divide before multiplying so axis-aligned steps stay exact; try_move truncates to whole pixels
+        dist = math.sqrt(dist_sq)
+        return dx / dist * speed, dy / dist * speed
+    return dx, dy
+
 class Enemy:
+    __slots__ = (
+        'enemy_type', 'rect', 'health', 'max_health',
+        'texture_name', 'speed', 'damage', 'behavior',
+        'attack_cooldown', 'state_timer',
+        'aggro_range', 'attack_range', 'aggro_range_sq', 'attack_range_sq',
+        'direction', 'patrol_points', 'patrol_index', 'target_position',
+        'last_position', 'stuck_counter',
+        'facing_right', 'animation_frame', 'animation_timer', 'animation_speed',
+        'is_attacking', 'is_hit', 'hit_animation_timer',
+    )
+
     def __init__(self, enemy_type: EnemyType, rect: pygame.Rect, health: int = 10):
         self.enemy_type = enemy_type
         self.rect = rect  # Position and size
         self.health = health
         self.max_health = health
-        self.speed = self.get_base_speed()
-        self.damage = self.get_base_damage()
-        self.behavior = self.get_default_behavior()
+        self.texture_name, self.speed, self.damage, self.behavior = ENEMY_STATS.get(enemy_type, DEFAULT_ENEMY_STATS)
         self.attack_cooldown = 0
         self.state_timer = 0
         self.aggro_range = 150  # Distance at which enemy notices player
         self.attack_range = 30  # Distance at which enemy can attack
-        self.direction = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
+        # Squared ranges so per-frame range checks can skip the sqrt
+        self.aggro_range_sq = self.aggro_range * self.aggro_range
+        self.attack_range_sq = self.attack_range * self.attack_range
+        self.direction = _choice(_ORTHO_DIRS)
         self.patrol_points = None
         self.patrol_index = 0
         self.target_position = None
         self.last_position = self.rect.topleft
         self.stuck_counter = 0
-        self.texture_name = self.get_texture_name()
         
         # Animation states
         self.facing_right = True
@@ -50,66 +135,33 @@ class Enemy:
     
     def get_texture_name(self) -> str:
         """Get the base texture name for the enemy type"""
-        if self.enemy_type == EnemyType.SLIME:
-            return "slime"
-        elif self.enemy_type == EnemyType.SKELETON:
-            return "skeleton"
-        elif self.enemy_type == EnemyType.GOBLIN:
-            return "goblin"
-        elif self.enemy_type == EnemyType.BAT:
-            return "bat"
-        elif self.enemy_type == EnemyType.SPIDER:
-            return "spider"
-        return "slime"  # Default
+        return ENEMY_STATS.get(self.enemy_type, DEFAULT_ENEMY_STATS)[0]
     
     def get_base_speed(self) -> int:
         """Get the base movement speed based on enemy type"""
-        if self.enemy_type == EnemyType.SLIME:
-            return 1
-        elif self.enemy_type == EnemyType.SKELETON:
-            return 2
-        elif self.enemy_type == EnemyType.GOBLIN:
-            return 3
-        elif self.enemy_type == EnemyType.BAT:
-            return 4
-        elif self.enemy_type == EnemyType.SPIDER:
-            return 2
-        return 1  # Default
+        return ENEMY_STATS.get(self.enemy_type, DEFAULT_ENEMY_STATS)[1]
     
     def get_base_damage(self) -> int:
         """Get the base attack damage based on enemy type"""
-        if self.enemy_type == EnemyType.SLIME:
-            return 5
-        elif self.enemy_type == EnemyType.SKELETON:
-            return 8
-        elif self.enemy_type == EnemyType.GOBLIN:
-            return 10
-        elif self.enemy_type == EnemyType.BAT:
-            return 3
-        elif self.enemy_type == EnemyType.SPIDER:
-            return 7
-        return 5  # Default
+        return ENEMY_STATS.get(self.enemy_type, DEFAULT_ENEMY_STATS)[2]
     
     def get_default_behavior(self) -> EnemyBehavior:
         """Get the default behavior based on enemy type"""
-        if self.enemy_type == EnemyType.SLIME:
-            return EnemyBehavior.PATROL
-        elif self.enemy_type == EnemyType.SKELETON:
-            return EnemyBehavior.AGGRESSIVE
-        elif self.enemy_type == EnemyType.GOBLIN:
-            return EnemyBehavior.AGGRESSIVE
-        elif self.enemy_type == EnemyType.BAT:
-            return EnemyBehavior.PATROL
-        elif self.enemy_type == EnemyType.SPIDER:
-            return EnemyBehavior.LURK
-        return EnemyBehavior.IDLE  # Default
+        return ENEMY_STATS.get(self.enemy_type, DEFAULT_ENEMY_STATS)[3]
 
     def set_patrol_points(self, points: List[Tuple[int, int]]):
         """Set patrol points for the enemy to move between"""
-        self.patrol_points = points
+        self.patrol_points = tuple((int(x), int(y)) for x, y in points)
         self.patrol_index = 0
         if self.patrol_points:
             self.target_position = self.patrol_points[0]
+
+    def scatter_patrol_points(self, spread: int, count: int = 2):
+        """Patrol between random points within spread pixels of the current position"""
+        ex, ey = self.rect.topleft
+        randint = random.randint
+        self.set_patrol_points([(ex + randint(-spread, spread), ey + randint(-spread, spread))
+                                for _ in range(count)])
     
     def take_damage(self, damage: int) -> bool:
         """Apply damage to the enemy and return True if it's defeated"""
@@ -119,65 +171,47 @@ class Enemy:
         
         # Chance to switch to flee behavior when hurt
         if self.health < self.max_health / 2 and random.random() < 0.3:
-            self.behavior = EnemyBehavior.FLEE
+            self.behavior = _FLEE
             self.state_timer = 60  # Flee for 60 frames
         
         return self.health <= 0
     
     def distance_to_player(self, player_rect: pygame.Rect) -> float:
         """Calculate distance to player"""
+        rect = self.rect
+        return math.hypot(player_rect.centerx - rect.centerx, player_rect.centery - rect.centery)
+
+    def distance_sq_to_point(self, px: int, py: int) -> int:
+        """Calculate squared distance from the enemy's center to a point"""
         enemy_center = self.rect.center
-        player_center = player_rect.center
-        dx = player_center[0] - enemy_center[0]
-        dy = player_center[1] - enemy_center[1]
-        return math.sqrt(dx*dx + dy*dy)
+        dx = px - enemy_center[0]
+        dy = py - enemy_center[1]
+        return dx*dx + dy*dy
 
     def update_behavior(self, player_rect: pygame.Rect):
         """Update enemy behavior based on player position and other factors"""
-        distance = self.distance_to_player(player_rect)
-
+        px, py = player_rect.center
+        
         # Check if lurking enemy should become aggressive
-        if self.behavior == EnemyBehavior.LURK and distance < self.aggro_range:
-            self.behavior = EnemyBehavior.AGGRESSIVE
+        if self.behavior == _LURK and self.distance_sq_to_point(px, py) < self.aggro_range_sq:
+            self.behavior = _AGGRESSIVE
 
         # Reset behavior after fleeing
-        if self.behavior == EnemyBehavior.FLEE and self.state_timer <= 0:
+        if self.behavior == _FLEE and self.state_timer <= 0:
             self.behavior = self.get_default_behavior()
 
         # If stuck, change behavior temporarily
         if self.stuck_counter > 10: # Increased threshold for getting stuck
-            self.behavior = EnemyBehavior.PATROL # Change to patrol to try to unstick
+            self.behavior = _PATROL # Change to patrol to try to unstick
             self.stuck_counter = 0 # Reset stuck counter
 
             # Create new random patrol points nearby to help unstick
-            current_x, current_y = self.rect.topleft
-            self.patrol_points = [
-                (current_x + random.randint(-50, 50), current_y + random.randint(-50, 50)), # Shorter patrol range
-                (current_x + random.randint(-50, 50), current_y + random.randint(-50, 50))
-            ]
-            self.patrol_index = 0
-            if self.patrol_points: # Ensure patrol_points is not empty
-                self.target_position = self.patrol_points[0]
+            self.scatter_patrol_points(50)  # Shorter patrol range
     
     def update_movement(self, player_rect: pygame.Rect, wall_check_func) -> bool:
         """Update enemy movement based on behavior. Returns True if attacking."""
-        # Decrement timers
-        if self.attack_cooldown > 0:
-            self.attack_cooldown -= 1
-        
-        if self.state_timer > 0:
-            self.state_timer -= 1
-        
-        if self.hit_animation_timer > 0:
-            self.hit_animation_timer -= 1
-        else:
-            self.is_hit = False
-            
-        # Update animation timer
-        self.animation_timer += 1
-        if self.animation_timer >= self.animation_speed:
-            self.animation_timer = 0
-            self.animation_frame = (self.animation_frame + 1) % 4  # 4 frames of animation
+        px, py = player_rect.center
+        self.tick_timers()
         
         # Check if position has changed
         current_pos = self.rect.topleft
@@ -187,122 +221,129 @@ class Enemy:
             self.stuck_counter = 0
             self.last_position = current_pos
         
-        # Handle different behaviors
-        if self.behavior == EnemyBehavior.IDLE:
-            # Just stand around
-            if random.random() < 0.01:  # 1% chance per frame to change direction
-                self.direction = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1), (0, 0)])
-            
-            dx, dy = self.direction
-            new_rect = self.rect.move(dx * self.speed, dy * self.speed)
-            if not wall_check_func(new_rect):
-                self.rect = new_rect
-                self.facing_right = dx >= 0
-        
-        elif self.behavior == EnemyBehavior.PATROL:
-            if self.patrol_points and self.target_position:
-                # Move toward the current patrol point
-                tx, ty = self.target_position
-                ex, ey = self.rect.topleft
-                
-                dx = tx - ex
-                dy = ty - ey
-                dist = math.sqrt(dx*dx + dy*dy)
-                
-                if dist < 10:  # Close enough to target
-                    # Move to next patrol point
-                    self.patrol_index = (self.patrol_index + 1) % len(self.patrol_points)
-                    self.target_position = self.patrol_points[self.patrol_index]
-                else:
-                    # Normalize direction and move
-                    if dist > 0:
-                        dx = dx / dist * self.speed
-                        dy = dy / dist * self.speed
-                    
-                    new_rect = self.rect.move(dx, dy)
-                    if not wall_check_func(new_rect):
-                        self.rect = new_rect
-                        self.facing_right = dx >= 0
-                    else:
-                        # Try moving just horizontally or vertically if direct path is blocked
-                        new_rect_h = self.rect.move(dx, 0)
-                        if not wall_check_func(new_rect_h):
-                            self.rect = new_rect_h
-                            self.facing_right = dx >= 0
-                        else:
-                            new_rect_v = self.rect.move(0, dy)
-                            if not wall_check_func(new_rect_v):
-                                self.rect = new_rect_v
-            else:
-                # Create random patrol points
-                ex, ey = self.rect.topleft
-                self.patrol_points = [
-                    (ex + random.randint(-100, 100), ey + random.randint(-100, 100)),
-                    (ex + random.randint(-100, 100), ey + random.randint(-100, 100))
-                ]
-                self.patrol_index = 0
-                self.target_position = self.patrol_points[0]
-        
-        elif self.behavior == EnemyBehavior.AGGRESSIVE:
-            # Move toward the player
-            player_center = player_rect.center
-            enemy_center = self.rect.center
+        # Run the step for the current behavior
+        return _BEHAVIOR_DISPATCH[self.behavior](self, px, py, wall_check_func)
+
+    def tick_timers(self):
+        """Advance the per-frame cooldown, state, hit flash and animation timers"""
+        # Timers never go below zero, so most frames can skip the countdown entirely
+        if self.attack_cooldown or self.state_timer or self.hit_animation_timer:
+            if self.attack_cooldown > 0:
+                self.attack_cooldown -= 1
             
-            dx = player_center[0] - enemy_center[0]
-            dy = player_center[1] - enemy_center[1]
-            dist = math.sqrt(dx*dx + dy*dy)
+            if self.state_timer > 0:
+                self.state_timer -= 1
             
-            # Check if in attack range
-            if dist <= self.attack_range and self.attack_cooldown <= 0:
-                self.attack_cooldown = 30  # 30 frames (0.5s at 60fps) between attacks
-                self.is_attacking = True
-                return True  # Signal attack
+            if self.hit_animation_timer > 0:
+                self.hit_animation_timer -= 1
+            else:
+                self.is_hit = False
+        else:
+            self.is_hit = False
             
-            # Move toward player if not in attack range
-            if dist > self.attack_range:
-                self.is_attacking = False
-                if dist > 0:
-                    dx = dx / dist * self.speed
-                    dy = dy / dist * self.speed
-                
-                new_rect = self.rect.move(dx, dy)
-                if not wall_check_func(new_rect):
-                    self.rect = new_rect
-                    self.facing_right = dx >= 0
-                else:
-                    # Try moving just horizontally or vertically if direct path is blocked
-                    new_rect_h = self.rect.move(dx, 0)
-                    if not wall_check_func(new_rect_h):
-                        self.rect = new_rect_h
-                        self.facing_right = dx >= 0
-                    else:
-                        new_rect_v = self.rect.move(0, dy)
-                        if not wall_check_func(new_rect_v):
-                            self.rect = new_rect_v
+        # Update animation timer
+        animation_timer = self.animation_timer + 1
+        if animation_timer >= self.animation_speed:
+            self.animation_timer = 0
+            self.animation_frame = (self.animation_frame + 1) % 4  # 4 frames of animation
+        else:
+            self.animation_timer = animation_timer
+
+    def _idle_step(self, px: int, py: int, wall_check_func) -> bool:
+        """Wander in a random direction, occasionally picking a new one"""
+        if _random() < 0.01:  # 1% chance per frame to change direction
+            self.direction = _choice(_IDLE_DIRS)
         
-        elif self.behavior == EnemyBehavior.LURK:
-            # Don't move, just wait for player to get close
-            pass
-            
-        elif self.behavior == EnemyBehavior.FLEE:
-            # Move away from player
-            player_center = player_rect.center
-            enemy_center = self.rect.center
-            
-            dx = enemy_center[0] - player_center[0]  # Reversed direction
-            dy = enemy_center[1] - player_center[1]  # Reversed direction
-            dist = math.sqrt(dx*dx + dy*dy)
+        dx, dy = self.direction
+        self.try_move(dx * self.speed, dy * self.speed, wall_check_func, slide=False)
+        return False
+
+    def _patrol_step(self, px: int, py: int, wall_check_func) -> bool:
+        """Walk between patrol points, creating some if there are none"""
+        if self.patrol_points and self.target_position:
+            # Move toward the current patrol point
+            tx, ty = self.target_position
+            ex, ey = self.rect.topleft
             
-            if dist > 0:
-                dx = dx / dist * self.speed
-                dy = dy / dist * self.speed
+            dx = tx - ex
+            dy = ty - ey
+            dist_sq = dx*dx + dy*dy
             
-            new_rect = self.rect.move(dx, dy)
-            if not wall_check_func(new_rect):
-                self.rect = new_rect
-                self.facing_right = dx >= 0
+            if dist_sq < PATROL_ARRIVE_DIST_SQ:  # Close enough to target
+                # Move to next patrol point
+                self.patrol_index = (self.patrol_index + 1) % len(self.patrol_points)
+                self.target_position = self.patrol_points[self.patrol_index]
+            else:
+                # Normalize direction and move
+                dx, dy = scale_to_speed(dx, dy, dist_sq, self.speed)
+                self.try_move(dx, dy, wall_check_func)
+        else:
+            # Create random patrol points
+            self.scatter_patrol_points(100)
+        return False
+
+    def _aggressive_step(self, px: int, py: int, wall_check_func) -> bool:
+        """Chase the player and attack when in range. Returns True if attacking."""
+        enemy_center = self.rect.center
+        
+        dx = px - enemy_center[0]
+        dy = py - enemy_center[1]
+        dist_sq = dx*dx + dy*dy
+        
+        # Check if in attack range
+        if dist_sq <= self.attack_range_sq and self.attack_cooldown <= 0:
+            self.attack_cooldown = 30  # 30 frames (0.5s at 60fps) between attacks
+            self.is_attacking = True
+            return True  # Signal attack
+        
+        # Move toward player if not in attack range
+        if dist_sq > self.attack_range_sq:
+            self.is_attacking = False
+            dx, dy = scale_to_speed(dx, dy, dist_sq, self.speed)
+            self.try_move(dx, dy, wall_check_func)
+        return False
+
+    def _lurk_step(self, px: int, py: int, wall_check_func) -> bool:
+        """Don't move, just wait for the player to get close"""
+        return False
+
+    def _flee_step(self, px: int, py: int, wall_check_func) -> bool:
+        """Move directly away from the player"""
+        enemy_center = self.rect.center
+        
+        dx = enemy_center[0] - px  # Reversed direction
+        dy = enemy_center[1] - py  # Reversed direction
+        dist_sq = dx*dx + dy*dy
         
-        return False  # Not attacking
+        dx, dy = scale_to_speed(dx, dy, dist_sq, self.speed)
+        self.try_move(dx, dy, wall_check_func, slide=False)
+        return False
+
+    def try_move(self, dx: float, dy: float, wall_check_func, slide: bool = True) -> bool:
+        """Move by (dx, dy) unless blocked by a wall. Returns True if the enemy moved.
+
+        With slide enabled a blocked move falls back to moving along just one axis.
+        The rect is moved in place and restored if every attempt is blocked.
+        """
+        rect = self.rect
+        x, y = rect.x, rect.y
+        step_x, step_y = int(dx), int(dy)  # Truncate like Rect.move does
+        
+        rect.x, rect.y = x + step_x, y + step_y
+        if not wall_check_func(rect):
+            self.facing_right = dx >= 0
+            return True
+        if slide:
+            # Try moving just horizontally or vertically if direct path is blocked
+            rect.y = y
+            if not wall_check_func(rect):
+                self.facing_right = dx >= 0
+                return True
+            rect.x, rect.y = x, y + step_y
+            if not wall_check_func(rect):
+                return True
+        rect.x, rect.y = x, y
+        return False
                 
     def draw(self, screen, texture_getter, is_hit=False):
         """
@@ -310,38 +351,38 @@ class Enemy:
         texture_getter: function that returns a pygame Surface when given a texture name
         is_hit: whether the enemy is currently being hit (for flash effect)
         """
-        # Get base texture
-        base_texture = texture_getter(self.texture_name)
-        
-        # Modify texture based on state
-        texture = base_texture.copy()
-        
-        # Flash red when hit
-        if self.is_hit or is_hit:
-            red_overlay = pygame.Surface(texture.get_size(), pygame.SRCALPHA)
-            red_overlay.fill((255, 0, 0, 128))  # Semi-transparent red
-            texture.blit(red_overlay, (0, 0))
+        if not self.is_visible(screen.get_rect()):
+            return
+        self.draw_health_bar(screen)
         
-        # Draw health bar
+        # Draw enemy
+        screen.blit(self.get_draw_texture(texture_getter, is_hit), self.rect)
+
+    def is_visible(self, view_rect: pygame.Rect) -> bool:
+        """Check whether the sprite or its health bar overlaps the view"""
+        rect = self.rect
+        return (rect.right > view_rect.left and rect.left < view_rect.right and
+                rect.bottom > view_rect.top and rect.top - HEALTH_BAR_OFFSET < view_rect.bottom)
+
+    def get_draw_texture(self, texture_getter, is_hit=False) -> pygame.Surface:
+        """Pick the cached texture variant for the hit flash and facing direction"""
+        variants = get_texture_variants(self.texture_name, texture_getter)
+        hit = self.is_hit or is_hit
+        return variants[2 * hit + (not self.facing_right)]
+
+    def draw_health_bar(self, screen):
+        """Draw the health bar above the enemy"""
         health_pct = self.health / self.max_health
         bar_width = self.rect.width
         health_width = int(bar_width * health_pct)
-        bar_height = 3
-        bar_y = self.rect.top - 5
+        bar_y = self.rect.top - HEALTH_BAR_OFFSET
         
         # Draw the red background
-        pygame.draw.rect(screen, (255, 0, 0), (self.rect.left, bar_y, bar_width, bar_height))
+        screen.fill(HEALTH_BAR_BG_COLOR, (self.rect.left, bar_y, bar_width, HEALTH_BAR_HEIGHT))
         
         # Draw the green health
         if health_width > 0:
-            pygame.draw.rect(screen, (0, 255, 0), (self.rect.left, bar_y, health_width, bar_height))
-        
-        # Draw enemy (flip texture if facing left)
-        if self.facing_right:
-            screen.blit(texture, self.rect)
-        else:
-            flipped = pygame.transform.flip(texture, True, False)
-            screen.blit(flipped, self.rect)
+            screen.fill(HEALTH_BAR_FG_COLOR, (self.rect.left, bar_y, health_width, HEALTH_BAR_HEIGHT))
 
     def to_dict(self):
         """Convert enemy to dictionary for saving"""
@@ -366,3 +407,57 @@ class Enemy:
         enemy.max_health = data.get('max_health', enemy.health)
         enemy.behavior = EnemyBehavior(data.get('behavior', enemy.behavior.value))
         return enemy
+
+
+# Per-behavior movement step, looked up once per enemy per frame
+_BEHAVIOR_DISPATCH = {
+    EnemyBehavior.IDLE: Enemy._idle_step,
+    EnemyBehavior.PATROL: Enemy._patrol_step,
+    EnemyBehavior.AGGRESSIVE: Enemy._aggressive_step,
+    EnemyBehavior.LURK: Enemy._lurk_step,
+    EnemyBehavior.FLEE: Enemy._flee_step,
+}
+
+
+# Binary save format for enemy batches: a version byte, then one fixed-size record per enemy
+ENEMY_BLOB_VERSION = 1
+ENEMY_RECORD = struct.Struct('<BiiHHhhB')  # type, x, y, width, height, health, max health, behavior
+
+class EnemyManager:
+    """Draws and saves a room's enemies as one batch"""
+
+    @staticmethod
+    def pack(enemies: List[Enemy]) -> bytes:
+        """Serialize a batch of enemies into one compact binary blob"""
+        pack_record = ENEMY_RECORD.pack
+        records = [pack_record(enemy.enemy_type.value, enemy.rect.x, enemy.rect.y, enemy.rect.width,
+                               enemy.rect.height, enemy.health, enemy.max_health, enemy.behavior.value)
+                   for enemy in enemies]
+        return bytes((ENEMY_BLOB_VERSION,)) + b''.join(records)
+
+    @staticmethod
+    def unpack(data: bytes) -> List[Enemy]:
+        """Rebuild a batch of enemies from a blob made by pack"""
+        if not data:
+            return []
+        if data[0] != ENEMY_BLOB_VERSION:
+            raise ValueError(f"Unsupported enemy data version: {data[0]}")
+        enemies = []
+        for type_value, x, y, width, height, health, max_health, behavior in ENEMY_RECORD.iter_unpack(memoryview(data)[1:]):
+            enemy = Enemy(EnemyType(type_value), pygame.Rect(x, y, width, height), health)
+            enemy.max_health = max_health
+            enemy.behavior = EnemyBehavior(behavior)
+            enemies.append(enemy)
+        return enemies
+
+    def draw_all(self, screen, enemies: List[Enemy], texture_getter, view_rect: Optional[pygame.Rect] = None):
+        """Draw every enemy in the batch that overlaps the view (the whole screen by default)"""
+        if view_rect is None:
+            view_rect = screen.get_rect()
+        
+        # Each enemy's health bar then sprite, in list order, so overlapping enemies layer as before
+        blit = screen.blit
+        for enemy in enemies:
+            if enemy.is_visible(view_rect):
+                enemy.draw_health_bar(screen)
+                blit(enemy.get_draw_texture(texture_getter), enemy.rect)
@@ -4,10 +4,11 @@ import json
 import random
 import os
 import math
-from enum import Enum
+import base64
+from enum import Enum, IntEnum
 from typing import Dict, Any, List, Tuple, Optional
 from dataclasses import dataclass, field, asdict
-from enemies import Enemy, EnemyType, EnemyBehavior
+from enemies import Enemy, EnemyType, EnemyBehavior, EnemyManager
 import resources
 
 # --- Constants ---
@@ -82,25 +83,45 @@ FONT_SIZE_LARGE = 42
 FONT_SIZE_MEDIUM = 28
 FONT_SIZE_SMALL = 20
 FONT_SIZE_TINY = 16
+TEXT_CACHE_SIZE = 512  # Rendered text surfaces kept before the oldest is dropped
 SAVE_FILE = "savegame.json"
 SETTINGS_FILE = "settings.json"
 
 TILE_SIZE = 32
+BACKGROUND_CHUNK_TILES = 8  # Room backgrounds are redrawn in chunks of this many tiles square
 GRID_WIDTH = SCREEN_WIDTH // TILE_SIZE
 GRID_HEIGHT = SCREEN_HEIGHT // TILE_SIZE
 
+# Room connections by the direction travelled: (entry tile in the room entered, exit tile in the room left)
+EXIT_COORDS = {
+    "north": ((GRID_WIDTH // 2, GRID_HEIGHT - 2), (GRID_WIDTH // 2, 0)),
+    "south": ((GRID_WIDTH // 2, 1), (GRID_WIDTH // 2, GRID_HEIGHT - 1)),
+    "east": ((1, GRID_HEIGHT // 2), (GRID_WIDTH - 1, GRID_HEIGHT // 2)),
+    "west": ((GRID_WIDTH - 2, GRID_HEIGHT // 2), (0, GRID_HEIGHT // 2)),
+}
+OPPOSITE_DIRECTIONS = {"north": "south", "south": "north", "east": "west", "west": "east"}
+
+QUEST_ACTION_TYPES = frozenset(("enter_room", "collect_item", "talk_to_npc"))  # Actions that can complete objectives
+
 # Audio settings
 DEFAULT_MASTER_VOLUME = 0.7
 DEFAULT_SFX_VOLUME = 0.8
 DEFAULT_MUSIC_VOLUME = 0.6
 
-class TileType(Enum):
+class TileType(IntEnum):
     FLOOR = 0
     WALL = 1
     EXIT = 2
     WATER = 3  # New tile type
     CHEST = 4  # Treasure chests
 
+# Tile values as plain ints, which is what the bytearray grid rows hold. Generators and the
+# renderer use these in their per-tile loops since reading a TileType member is several times slower.
+FLOOR_TILE, WALL_TILE, EXIT_TILE, WATER_TILE, CHEST_TILE = (int(tile) for tile in TileType)
+
+# bytes.translate table that keeps exits and turns every other tile into floor, for room edges
+EDGE_TILE_TABLE = bytes(EXIT_TILE if value == EXIT_TILE else FLOOR_TILE for value in range(256))
+
 class GameState(Enum):
     TITLE_SCREEN = 0  # Title screen with options
     NAME_INPUT = 1    # Character name input
@@ -115,7 +136,7 @@ class GameState(Enum):
     LOAD_MENU = 10    # Load game menu with slots
     COMBAT = 11       # Combat interaction
 
-class ItemType(Enum):
+class ItemType(IntEnum):
     CONSUMABLE = 1
     KEY_ITEM = 2
     WEAPON = 3
@@ -156,7 +177,7 @@ PERSONALITY_COLORS = {
     NPCPersonality.MELANCHOLIC: (100, 100, 150),  # Dark blue
 }
 
-@dataclass
+@dataclass(slots=True)
 class GameSettings:
     master_volume: float = DEFAULT_MASTER_VOLUME
     sfx_volume: float = DEFAULT_SFX_VOLUME
@@ -183,7 +204,7 @@ class GameSettings:
             fullscreen=data.get('fullscreen', False)
         )
 
-@dataclass
+@dataclass(slots=True)
 class Quest:
     id: str
     title: str
@@ -219,7 +240,7 @@ class Quest:
             reward_text=data.get('reward_text', '')
         )
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     name: str
     description: str
@@ -234,7 +255,7 @@ class Item:
         return {
             'name': self.name,
             'description': self.description,
-            'item_type': self.item_type.value,
+            'item_type': self.item_type,  # An IntEnum, so it saves as its int value
             'quantity': self.quantity,
             'value': self.value,
             'x': self.x,
@@ -253,7 +274,7 @@ class Item:
             y=data.get('y')
         )
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     name: str
     rect: pygame.Rect # Player's position and size
@@ -267,6 +288,18 @@ class Player:
     gold: int = 50  # Starting gold
     active_quests: List[str] = field(default_factory=list)  # Quest IDs
     attack_cooldown: int = 0  # Attack cooldown timer
+    # Item name -> inventory entries with that name, in inventory order
+    inventory_index: Dict[str, List[Item]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Index the starting inventory by item name"""
+        self.rebuild_inventory_index()
+
+    def rebuild_inventory_index(self):
+        """Re-index the inventory, e.g. after editing the list directly"""
+        self.inventory_index = {}
+        for item in self.inventory:
+            self.inventory_index.setdefault(item.name, []).append(item)
 
     def to_dict(self):
         return {
@@ -304,26 +337,31 @@ class Player:
             attack_cooldown=data.get('attack_cooldown', 0)
         )
 
+    def add_item(self, item: Item):
+        self.inventory.append(item)
+        self.inventory_index.setdefault(item.name, []).append(item)
+
     def has_item(self, item_name: str) -> bool:
-        return any(item.name == item_name for item in self.inventory)
+        return item_name in self.inventory_index
     
     def get_item(self, item_name: str) -> Optional[Item]:
-        for item in self.inventory:
-            if item.name == item_name:
-                return item
-        return None
+        items = self.inventory_index.get(item_name)
+        return items[0] if items else None
     
     def remove_item(self, item_name: str, quantity: int = 1) -> bool:
-        for item in self.inventory:
-            if item.name == item_name:
-                if item.quantity >= quantity:
-                    item.quantity -= quantity
-                    if item.quantity <= 0:
-                        self.inventory.remove(item)
-                    return True
+        items = self.inventory_index.get(item_name, ())
+        for item in items:
+            if item.quantity >= quantity:
+                item.quantity -= quantity
+                if item.quantity <= 0:
+                    self.inventory.remove(item)
+                    items.remove(item)
+                    if not items:
+                        del self.inventory_index[item_name]
+                return True
         return False
 
-@dataclass
+@dataclass(slots=True)
 class NPC:
     name: str
     rect: pygame.Rect # NPC's position and size
@@ -347,6 +385,7 @@ class NPC:
     # NPC behavior
     movement_pattern: str = "stationary"  # stationary, wander, patrol
     patrol_points: List[Tuple[int, int]] = field(default_factory=list)
+    patrol_index: int = 0  # Next patrol point to visit
     movement_timer: int = 0
     home_position: Tuple[int, int] = (0, 0)  # Original spawn position
     
@@ -357,9 +396,8 @@ class NPC:
     def __post_init__(self):
         """Initialize derived properties after creation"""
         self.home_position = (self.rect.centerx, self.rect.centery)
-        # Set color based on personality
-        if self.personality in PERSONALITY_COLORS:
-            self.color = PERSONALITY_COLORS[self.personality]
+        # Set color based on personality, converted once so draw calls get a ready pygame.Color
+        self.color = pygame.Color(PERSONALITY_COLORS.get(self.personality, self.color))
         # Generate contextual responses based on personality
         self.generate_personality_responses()
     
@@ -529,9 +567,6 @@ class NPC:
             self.movement_timer = random.randint(180, 600)  # 3-10 seconds
         elif self.movement_pattern == "patrol" and self.patrol_points and self.movement_timer <= 0:
             # Move between patrol points
-            if not hasattr(self, 'patrol_index'):
-                self.patrol_index = 0
-            
             target_x, target_y = self.patrol_points[self.patrol_index]
             self.rect.centerx = target_x
             self.rect.centery = target_y
@@ -547,7 +582,7 @@ class NPC:
             'name': self.name,
             'rect': {'x': self.rect.x, 'y': self.rect.y, 'width': self.rect.width, 'height': self.rect.height},
             'dialogue_options': self.dialogue_options,
-            'color': self.color,
+            'color': (self.color.r, self.color.g, self.color.b),
             'quest_giver': self.quest_giver,
             'quest_id': self.quest_id,
             'shop_items': [item.to_dict() for item in self.shop_items],
@@ -606,7 +641,7 @@ class NPC:
             name=data['name'],
             rect=rect,
             dialogue_options=data.get('dialogue_options', []),
-            color=tuple(data.get('color', NPC_COLOR)),
+            color=data.get('color', NPC_COLOR),
             quest_giver=data.get('quest_giver', False),
             quest_id=data.get('quest_id'),
             shop_items=[],  # Will be populated below
@@ -631,20 +666,132 @@ class NPC:
         return npc
 
 
+# Wall-cluster stamps for clearing edge features: size -> [(dx, dy, placement chance)]
+# Chance falls off with Manhattan distance so clusters are concentrated near their center
+CLEARING_CLUSTER_STAMPS = {
+    size: [(dx, dy, 0.7 / (abs(dx) + abs(dy) + 0.5))
+           for dy in range(-size, size + 1) for dx in range(-size, size + 1)]
+    for size in (1, 2)
+}
+RUINS_DEBRIS_STAMPS = {  # size -> [(dx, dy, rubble chance)], same falloff as the clearing clusters
+    size: [(dx, dy, 0.4 / (abs(dx) + abs(dy) + 0.5))
+           for dy in range(-size, size + 1) for dx in range(-size, size + 1)]
+    for size in (1, 2)
+}
+
+# The 3x3 block around a tile, in row-major order
+NEIGHBORHOOD_3X3 = tuple((dx, dy) for dy in range(-1, 2) for dx in range(-1, 2))
+
+# bytes.translate tables turning a row into binary digits: '1' where it holds the tile, '0' elsewhere
+ROW_DIGIT_TABLES = {tile: bytes(ord('1') if value == tile else ord('0') for value in range(256)) for tile in TileType}
+
+def tile_row_mask(row: bytearray, tile: int) -> int:
+    """Get a bitmask with bit x set where row[x] is the given tile"""
+    # Reverse so column 0 becomes the lowest bit, then parse the digits in one C call
+    return int(row.translate(ROW_DIGIT_TABLES[tile])[::-1], 2)
+
+def dilate_row_masks(masks: List[int]) -> List[int]:
+    """Grow per-row bitmasks by one cell in all 8 directions (a 3x3 dilation)"""
+    spread = [mask | (mask << 1) | (mask >> 1) for mask in masks]
+    last = len(spread) - 1
+    return [spread[r] | (spread[r - 1] if r > 0 else 0) | (spread[r + 1] if r < last else 0)
+            for r in range(len(spread))]
+
+def rect_perimeter(x: int, y: int, w: int, h: int) -> List[Tuple[int, int]]:
+    """Get the border cells of a w x h tile rectangle in row-major order"""
+    cells = [(x + dx, y) for dx in range(w)]
+    for cy in range(y + 1, y + h - 1):
+        cells.append((x, cy))
+        if w > 1:
+            cells.append((x + w - 1, cy))
+    if h > 1:
+        cells.extend((x + dx, y + h - 1) for dx in range(w))
+    return cells
+
+def rect_edge_cells(x: int, y: int, w: int, h: int) -> List[Tuple[int, int, int, int]]:
+    """Get the non-corner border cells of a rectangle at least 3x3, in row-major order,
+    each as (x, y, outward dx, outward dy)"""
+    cells = [(cx, y, 0, -1) for cx in range(x + 1, x + w - 1)]
+    for cy in range(y + 1, y + h - 1):
+        cells.append((x, cy, -1, 0))
+        cells.append((x + w - 1, cy, 1, 0))
+    cells.extend((cx, y + h - 1, 0, 1) for cx in range(x + 1, x + w - 1))
+    return cells
+
+_spaced_positions: Dict[Tuple[int, int], Tuple[int, ...]] = {}
+
+def spaced_positions(count: int, length: int) -> Tuple[int, ...]:
+    """Get count positions spread evenly along an edge of the given length, excluding both ends"""
+    key = (count, length)
+    if key not in _spaced_positions:
+        _spaced_positions[key] = tuple(int(length * (i + 1) / (count + 1)) for i in range(count))
+    return _spaced_positions[key]
+
+NEIGHBORS4 = ((1, 0), (0, 1), (-1, 0), (0, -1))  # The four orthogonal neighbour offsets
+
+# Round feature stamps, precomputed per size so generators skip the per-cell square roots.
+# Offsets are in row-major order, matching the order the generators draw random numbers in.
+# Entries are (dx, dy, placement chance); a chance of None places the cell without a roll.
+CLEARING_POOL_STAMPS = {  # size -> cells inside the oval pool
+    size: [(dx, dy, None) for dy in range(-size, size + 1) for dx in range(-size, size + 1)
+           if math.sqrt(dx**2 + dy**2) < size * 0.8]
+    for size in (2, 3)
+}
+MONUMENT_RING_STAMPS = {  # size -> cells on the monument's outer ring
+    size: [(dx, dy, 0.75) for dy in range(-size, size + 1) for dx in range(-size, size + 1)
+           if size - 0.8 <= math.sqrt(dx*dx + dy*dy) <= size]
+    for size in (3, 4, 5)
+}
+WALL_CLUSTER_STAMP = [(dx, dy, 0.7) for dx, dy in NEIGHBORS4]  # Neighbours of a generic-room wall cluster
+PILLAR_CLUSTER_STAMP = [(1, 0, 0.5), (0, 1, 0.5), (1, 1, 0.5), (-1, 0, 0.5), (0, -1, 0.5)]  # Growth around a pillar
+MONUMENT_CROSS_STAMP = [(dx, dy, None) for dy in range(-1, 2) for dx in range(-1, 2) if abs(dx) + abs(dy) <= 1]
+SWAMP_POOL_STAMPS = {  # size -> [(dx, dy, stretched distance from center)]
+    size: [(dx, dy, math.sqrt((dx/1.5)**2 + (dy/1.8)**2))
+           for dy in range(-size, size + 1) for dx in range(-size, size + 1)]
+    for size in range(4, 8)
+}
+# Chance of a rock beside a mountain ridge, indexed by Manhattan distance from the ridge tile
+RIDGE_SCATTER_CHANCES = tuple(0.7 / (distance + 0.1) for distance in range(5))
+CAVE_POOL_STAMPS = {  # size -> [(dx, dy, oval distance from the pool's center)], anchored at the top-left corner
+    size: [(dx, dy, (dx - size/2)**2 / (size/1.5)**2 + (dy - size/2)**2 / (size/1.8)**2)
+           for dy in range(-1, size + 1) for dx in range(-1, size + 1)]
+    for size in (3, 4, 5)
+}
+BOULDER_STAMPS = {  # size -> [(dx, dy, rock chance)] within the boulder's radius
+    size: [(dx, dy, (size - math.sqrt(dx**2 + dy**2)) / size)
+           for dy in range(-size, size + 1) for dx in range(-size, size + 1)
+           if math.sqrt(dx**2 + dy**2) <= size]
+    for size in (2, 3, 4)
+}
+# Scattered objects every room gets: tile to place (None for a wall cluster) and its weight
+RANDOM_OBJECT_TILES = (WALL_TILE, WATER_TILE, CHEST_TILE, None)
+RANDOM_OBJECT_WEIGHTS = (0.5, 0.3, 0.1, 0.1)
+
 class Room:
-    def __init__(self, name: str, grid_width: int, grid_height: int, room_type: str = "cave"):
-        self.name = name
+    __slots__ = (
+        'name', 'grid_width', 'grid_height', 'room_type', 'grid',
+        'items', 'npcs', 'enemies', 'exits', 'visited', 'difficulty_level',
+        'wall_rows', 'floor_tiles', 'background', 'dirty_chunks', 'floor_texture', 'wall_texture',
+    )
+
+    def __init__(self, name: str, grid_width: int, grid_height: int, room_type: str = "cave", generate: bool = True):
+        self.name = sys.intern(name)  # Used as the self.rooms key and in exits on every transition
         self.grid_width = grid_width
         self.grid_height = grid_height
-        self.room_type = room_type  # cave, forest, dungeon, village, etc.
-        self.grid: List[List[TileType]] = []
+        self.room_type = sys.intern(room_type)  # cave, forest, dungeon, village, etc.
+        self.grid: List[bytearray] = []  # One byte per tile (a TileType value), one bytearray per row
         self.items: List[Item] = []
         self.npcs: List[NPC] = []
         self.enemies: List[Enemy] = []  # List of enemies in the room
         self.exits: Dict[str, Tuple[str, int, int]] = {} # direction: (target_room_name, entry_tile_x, entry_tile_y)
         self.visited = False
         self.difficulty_level = 1  # For procedural content scaling
-        self.generate_procedural_layout()
+        self.wall_rows: Optional[List[int]] = None  # Per-row wall bitmasks, built on first collision check
+        self.floor_tiles: Optional[List[Tuple[int, int]]] = None  # Floor tile positions, built on first placement
+        self.background: Optional[pygame.Surface] = None  # Pre-rendered tiles, built on first draw
+        self.dirty_chunks: set = set()  # (chunk_x, chunk_y) background chunks to redraw before the next use
+        if generate:  # Loaded rooms skip generation; from_dict supplies the grid
+            self.generate_procedural_layout()
         
         # Texture names for this room
         self.floor_texture = f"{room_type}_floor"
@@ -652,7 +799,7 @@ class Room:
 
     def generate_procedural_layout(self):
         # Initialize grid with floors instead of walls
-        self.grid = [[TileType.FLOOR for _ in range(self.grid_width)] for _ in range(self.grid_height)]
+        self.grid = [bytearray((FLOOR_TILE,)) * self.grid_width for _ in range(self.grid_height)]
 
         # No more wall margins - the entire room is open
         room_x = 0
@@ -667,30 +814,19 @@ class Room:
         self.add_potential_exits()
         
         # Generate room-specific features based on type
-        if self.room_type == "cave":
-            self.generate_cave_features()
-        elif self.room_type == "forest":
-            self.generate_forest_features()
-        elif self.room_type == "dungeon":
-            self.generate_dungeon_features()
-        elif self.room_type == "village":
-            self.generate_village_features()
-        elif self.room_type == "clearing":
-            self.generate_clearing_features()
-        elif self.room_type == "ruins":
-            self.generate_ruins_features()
-        elif self.room_type == "swamp":
-            self.generate_swamp_features()
-        elif self.room_type == "mountain":
-            self.generate_mountain_features()
-        else:
-            self.generate_generic_features()
+        ROOM_FEATURE_GENERATORS.get(self.room_type, Room.generate_generic_features)(self)
     
     def generate_clearing_features(self):
         """Generate clearing-specific features like flowers and peaceful elements with natural patterns"""
         room_x, room_y = 2, 2
         room_w, room_h = self.grid_width - 4, self.grid_height - 4
         
+        # Bind hot lookups once for the loops below
+        grid = self.grid
+        rand, randint, uniform = random.random, random.randint, random.uniform
+        cos, sin = math.cos, math.sin
+        wall, water = WALL_TILE, WATER_TILE
+        
         # Create a central clearing area
         clearing_center_x = room_x + room_w // 2
         clearing_center_y = room_y + room_h // 2
@@ -702,15 +838,15 @@ class Room:
         
         # Distribute edge features evenly around the perimeter
         for i in range(num_edge_features):
-            angle = 2 * math.pi * i / num_edge_features
+            angle = math.tau * i / num_edge_features
             
             # Get position on an elliptical perimeter
-            perimeter_x = clearing_center_x + int((room_w / 2 - 3) * math.cos(angle))
-            perimeter_y = clearing_center_y + int((room_h / 2 - 3) * math.sin(angle))
+            perimeter_x = clearing_center_x + int((room_w / 2 - 3) * cos(angle))
+            perimeter_y = clearing_center_y + int((room_h / 2 - 3) * sin(angle))
             
             # Add small variation
-            perimeter_x += random.randint(-2, 2)
-            perimeter_y += random.randint(-2, 2)
+            perimeter_x += randint(-2, 2)
+            perimeter_y += randint(-2, 2)
             
             # Ensure within bounds
             perimeter_x = max(room_x + 1, min(room_x + room_w - 2, perimeter_x))
@@ -721,66 +857,119 @@ class Room:
         # Place trees/rocks (wall tiles) at the edge of the clearing
         for feature_x, feature_y in edge_features:
             # Create small clusters for each feature point
-            feature_size = random.randint(1, 2)
-            for dy in range(-feature_size, feature_size + 1):
-                for dx in range(-feature_size, feature_size + 1):
-                    if random.random() < 0.7 / (abs(dx) + abs(dy) + 0.5):  # More concentrated near center
-                        nx, ny = feature_x + dx, feature_y + dy
-                        if (room_x <= nx < room_x + room_w and 
-                            room_y <= ny < room_y + room_h):
-                            self.grid[ny][nx] = TileType.WALL
-        
-        # Add flower patches (represented with alternative floor patterns)
-        num_patches = random.randint(4, 8)
-        for _ in range(num_patches):
-            # Flower patches more likely in the central area
-            dist = random.random() * clearing_radius
-            angle = random.uniform(0, 2 * math.pi)
-            patch_x = int(clearing_center_x + dist * math.cos(angle))
-            patch_y = int(clearing_center_y + dist * math.sin(angle))
-            
-            # Vary patch size
-            patch_size = random.randint(2, 4)
-            
-            # Create natural-looking flower patch shape
-            for dy in range(-patch_size, patch_size + 1):
-                for dx in range(-patch_size, patch_size + 1):
-                    dist_from_center = math.sqrt(dx**2 + dy**2)
-                    if (dist_from_center <= patch_size * random.uniform(0.5, 0.8) and
-                        patch_y + dy < room_y + room_h - 1 and 
-                        patch_x + dx < room_x + room_w - 1 and
-                        patch_y + dy >= room_y and 
-                        patch_x + dx >= room_x):
-                        # Keep as floor but add visual elements
-                        # In the future this could be a special tile type
-                        pass  # Flowers would be represented visually
+            feature_size = randint(1, 2)
+            self.apply_stamp(feature_x, feature_y, CLEARING_CLUSTER_STAMPS[feature_size], wall,
+                             room_x, room_y, room_x + room_w, room_y + room_h)
+        
+        # Flower patches would go here once there is a tile type to show them;
+        # until then the clearing floor is left plain
         
         # Add a small water feature in the center
-        if random.random() < 0.7:  # 70% chance for central water feature
-            water_size = random.randint(2, 3)
-            for dy in range(-water_size, water_size + 1):
-                for dx in range(-water_size, water_size + 1):
-                    dist_from_center = math.sqrt(dx**2 + dy**2)
-                    if (dist_from_center < water_size * 0.8 and  # Oval shape
-                        clearing_center_y + dy < room_y + room_h - 1 and 
-                        clearing_center_x + dx < room_x + room_w - 1 and
-                        clearing_center_y + dy >= room_y and
-                        clearing_center_x + dx >= room_x):
-                        self.grid[clearing_center_y + dy][clearing_center_x + dx] = TileType.WATER
+        if rand() < 0.7:  # 70% chance for central water feature
+            water_size = randint(2, 3)
+            self.apply_stamp(clearing_center_x, clearing_center_y, CLEARING_POOL_STAMPS[water_size], water,  # Oval shape
+                             room_x, room_y, room_x + room_w - 1, room_y + room_h - 1)
         
         # Add a few scattered standalone trees/rocks inside the clearing
-        num_standalone = random.randint(3, 6)
+        num_standalone = randint(3, 6)
         for _ in range(num_standalone):
             # Position away from center
-            dist = random.random() * clearing_radius * 0.7
-            angle = random.uniform(0, 2 * math.pi)
-            feature_x = int(clearing_center_x + dist * math.cos(angle))
-            feature_y = int(clearing_center_y + dist * math.sin(angle))
+            dist = rand() * clearing_radius * 0.7
+            angle = uniform(0, math.tau)
+            feature_x = int(clearing_center_x + dist * cos(angle))
+            feature_y = int(clearing_center_y + dist * sin(angle))
             
             if (room_x < feature_x < room_x + room_w - 1 and 
                 room_y < feature_y < room_y + room_h - 1):
-                self.grid[feature_y][feature_x] = TileType.WALL
+                grid[feature_y][feature_x] = wall
     
+    def apply_stamp(self, center_x: int, center_y: int, stamp: List[Tuple[int, int, Optional[float]]],
+                    tile: int, left: int, top: int, right: int, bottom: int):
+        """Set a stamp's cells around a center to a tile, clipped to columns left..right-1 and rows top..bottom-1
+
+        Cells with a chance are rolled before the bounds check, so clipped cells still use up their roll.
+        """
+        grid = self.grid
+        rand = random.random
+        for dx, dy, chance in stamp:
+            if chance is not None and rand() >= chance:
+                continue
+            x, y = center_x + dx, center_y + dy
+            if left <= x < right and top <= y < bottom:
+                grid[y][x] = tile
+
+    def fill_rect(self, x: int, y: int, w: int, h: int, tile: int):
+        """Set every tile of a w x h rectangle to a tile, clipped to the grid"""
+        left, right = max(x, 0), min(x + w, self.grid_width)
+        if left >= right:
+            return
+        span = bytes((tile,)) * (right - left)
+        for row in self.grid[max(y, 0):max(y + h, 0)]:
+            row[left:right] = span
+
+    def place_wall_cluster(self, x: int, y: int):
+        """Place a wall with a chance of a wall on each side of it, kept off the room's outer ring"""
+        self.grid[y][x] = WALL_TILE
+        self.apply_stamp(x, y, WALL_CLUSTER_STAMP, WALL_TILE, 1, 1, self.grid_width - 1, self.grid_height - 1)
+
+    def outline_rect(self, x: int, y: int, w: int, h: int, tile: int, gaps: Tuple[Tuple[int, int], ...] = ()):
+        """Set the border of a w x h tile rectangle to a tile, clipped to the grid's right and bottom edges
+
+        Border cells listed in gaps (as (x, y), e.g. doorways) are left as they were.
+        """
+        right = min(x + w, self.grid_width)
+        bottom = min(y + h, self.grid_height)
+        if x >= right or y >= bottom:
+            return
+        # Remember the gap tiles, paint the whole border with slice writes, then put the gaps back
+        kept = [(gx, gy, self.grid[gy][gx]) for gx, gy in gaps if gx < right and gy < bottom]
+        edge = bytes((tile,)) * (right - x)
+        self.grid[y][x:right] = edge
+        if y + h - 1 < bottom:
+            self.grid[y + h - 1][x:right] = edge
+        last_x = x + w - 1
+        for row in self.grid[y + 1:min(y + h - 1, bottom)]:
+            row[x] = tile
+            if last_x < right:
+                row[last_x] = tile
+        for gx, gy, old_tile in kept:
+            self.grid[gy][gx] = old_tile
+
+    def place_broken_walls(self, cells: List[Tuple[int, int]], chance: float):
+        """Turn each listed cell into a wall with the given chance, rolling once per cell"""
+        grid = self.grid
+        rand = random.random
+        wall = WALL_TILE
+        grid_width, grid_height = self.grid_width, self.grid_height
+        for x, y in cells:
+            if rand() < chance and x < grid_width and y < grid_height:
+                grid[y][x] = wall
+
+    def place_ruined_wall_line(self, wall_x: int, wall_y: int, length: int, horizontal: bool):
+        """Draw a straight wall with random gaps, sometimes thickened by a tile to either side"""
+        grid = self.grid
+        rand = random.random
+        choice = random.choice
+        wall = WALL_TILE
+        grid_width, grid_height = self.grid_width, self.grid_height
+        # Step along the wall; thickening goes across it
+        step_x, step_y = (1, 0) if horizontal else (0, 1)
+        across_x, across_y = step_y, step_x
+        sides = (-1, 1)
+        
+        for i in range(length):
+            if rand() < 0.85:  # 85% chance for wall segment
+                x, y = wall_x + step_x * i, wall_y + step_y * i
+                if y < grid_height and x < grid_width:
+                    grid[y][x] = wall
+                    
+                    # Sometimes make the wall thicker
+                    if rand() < 0.4:  # 40% chance
+                        thickness = choice(sides)
+                        tx, ty = x + across_x * thickness, y + across_y * thickness
+                        if 0 <= tx < grid_width and 0 <= ty < grid_height:
+                            grid[ty][tx] = wall
+
     def generate_ruins_features(self):
         """Generate ruins-specific features like broken walls and debris with natural patterns"""
         room_x, room_y = 2, 2
@@ -801,14 +990,7 @@ class Room:
                 temple_y = random.randint(room_y + 2, room_y + room_h - temple_h - 2)
                 
                 # Create temple outline (with gaps for broken walls)
-                for dy in range(temple_h):
-                    for dx in range(temple_w):
-                        # Only draw perimeter
-                        if dy == 0 or dy == temple_h - 1 or dx == 0 or dx == temple_w - 1:
-                            # Add gaps for ruins effect
-                            if random.random() < 0.7:  # 70% chance for wall piece
-                                if temple_y + dy < self.grid_height and temple_x + dx < self.grid_width:
-                                    self.grid[temple_y + dy][temple_x + dx] = TileType.WALL
+                self.place_broken_walls(rect_perimeter(temple_x, temple_y, temple_w, temple_h), 0.7)  # 70% chance for wall piece
                 
                 # Add columns (regularly spaced but some missing)
                 col_spacing = 2
@@ -816,12 +998,12 @@ class Room:
                     # Front row columns
                     if random.random() < 0.7:  # 70% chance for column
                         if temple_y + 1 < self.grid_height and col_x < self.grid_width:
-                            self.grid[temple_y + 1][col_x] = TileType.WALL
+                            self.grid[temple_y + 1][col_x] = WALL_TILE
                     
                     # Back row columns
                     if random.random() < 0.7:  # 70% chance for column
                         if temple_y + temple_h - 2 < self.grid_height and col_x < self.grid_width:
-                            self.grid[temple_y + temple_h - 2][col_x] = TileType.WALL
+                            self.grid[temple_y + temple_h - 2][col_x] = WALL_TILE
                 
             elif ruin_type == "building":
                 # Create building ruins (rooms with corridors)
@@ -835,26 +1017,16 @@ class Room:
                 for _ in range(num_divisions):
                     is_horizontal = random.choice([True, False])
                     
+                    # Create gaps in the division wall
                     if is_horizontal:
                         div_y = building_y + random.randint(2, building_h - 2)
-                        for dx in range(building_w):
-                            # Create gaps in the division wall
-                            if random.random() < 0.8 and building_x + dx < self.grid_width and div_y < self.grid_height:  # 80% chance
-                                self.grid[div_y][building_x + dx] = TileType.WALL
+                        self.place_broken_walls([(building_x + dx, div_y) for dx in range(building_w)], 0.8)  # 80% chance
                     else:
                         div_x = building_x + random.randint(2, building_w - 2)
-                        for dy in range(building_h):
-                            # Create gaps in the division wall
-                            if random.random() < 0.8 and div_x < self.grid_width and building_y + dy < self.grid_height:  # 80% chance
-                                self.grid[building_y + dy][div_x] = TileType.WALL
+                        self.place_broken_walls([(div_x, building_y + dy) for dy in range(building_h)], 0.8)  # 80% chance
                 
                 # Create the outer walls with larger gaps (more broken)
-                for dy in range(building_h):
-                    for dx in range(building_w):
-                        if dy == 0 or dy == building_h - 1 or dx == 0 or dx == building_w - 1:
-                            if random.random() < 0.65:  # 65% chance for wall
-                                if building_y + dy < self.grid_height and building_x + dx < self.grid_width:
-                                    self.grid[building_y + dy][building_x + dx] = TileType.WALL
+                self.place_broken_walls(rect_perimeter(building_x, building_y, building_w, building_h), 0.65)  # 65% chance for wall
             
             elif ruin_type == "wall":
                 # Create a linear wall ruin
@@ -864,33 +1036,12 @@ class Room:
                 if is_horizontal:
                     wall_y = random.randint(room_y + 2, room_y + room_h - 3)
                     wall_x = random.randint(room_x + 2, room_x + room_w - wall_length - 2)
-                    
-                    # Draw the wall with gaps and occasional thickness
-                    for dx in range(wall_length):
-                        if random.random() < 0.85:  # 85% chance for wall segment
-                            if wall_y < self.grid_height and wall_x + dx < self.grid_width:
-                                self.grid[wall_y][wall_x + dx] = TileType.WALL
-                                
-                                # Sometimes make the wall thicker
-                                if random.random() < 0.4:  # 40% chance
-                                    thickness = random.choice([-1, 1])
-                                    if 0 <= wall_y + thickness < self.grid_height:
-                                        self.grid[wall_y + thickness][wall_x + dx] = TileType.WALL
                 else:
                     wall_x = random.randint(room_x + 2, room_x + room_w - 3)
                     wall_y = random.randint(room_y + 2, room_y + room_h - wall_length - 2)
-                    
-                    # Draw the wall with gaps
-                    for dy in range(wall_length):
-                        if random.random() < 0.85:  # 85% chance for wall segment
-                            if wall_y + dy < self.grid_height and wall_x < self.grid_width:
-                                self.grid[wall_y + dy][wall_x] = TileType.WALL
-                                
-                                # Sometimes make the wall thicker
-                                if random.random() < 0.4:  # 40% chance
-                                    thickness = random.choice([-1, 1])
-                                    if 0 <= wall_x + thickness < self.grid_width:
-                                        self.grid[wall_y + dy][wall_x + thickness] = TileType.WALL
+                
+                # Draw the wall with gaps and occasional thickness
+                self.place_ruined_wall_line(wall_x, wall_y, wall_length, is_horizontal)
             
             elif ruin_type == "monument":
                 # Create a monument ruin (circular or special pattern)
@@ -899,22 +1050,13 @@ class Room:
                 monument_size = random.randint(3, 5)
                 
                 # Draw circular monument
-                for dy in range(-monument_size, monument_size + 1):
-                    for dx in range(-monument_size, monument_size + 1):
-                        distance = math.sqrt(dx*dx + dy*dy)
-                        if monument_size - 0.8 <= distance <= monument_size and random.random() < 0.75:
-                            if (monument_y + dy < self.grid_height and monument_x + dx < self.grid_width and
-                                monument_y + dy >= room_y and monument_x + dx >= room_x):
-                                self.grid[monument_y + dy][monument_x + dx] = TileType.WALL
+                self.apply_stamp(monument_x, monument_y, MONUMENT_RING_STAMPS[monument_size], WALL_TILE,
+                                 room_x, room_y, self.grid_width, self.grid_height)
                 
                 # Add some internal structure
                 if random.random() < 0.7:  # 70% chance
-                    for dy in range(-1, 2):
-                        for dx in range(-1, 2):
-                            if abs(dx) + abs(dy) <= 1:  # Cross pattern
-                                if (monument_y + dy < self.grid_height and monument_x + dx < self.grid_width and
-                                    monument_y + dy >= room_y and monument_x + dx >= room_x):
-                                    self.grid[monument_y + dy][monument_x + dx] = TileType.WALL
+                    self.apply_stamp(monument_x, monument_y, MONUMENT_CROSS_STAMP, WALL_TILE,  # Cross pattern
+                                     room_x, room_y, self.grid_width, self.grid_height)
         
         # Add scattered debris (small rubble piles)
         num_debris = random.randint(6, 12)
@@ -923,44 +1065,44 @@ class Room:
             debris_y = random.randint(room_y + 1, room_y + room_h - 3)
             debris_size = random.randint(1, 2)
             
-            # Create small debris cluster
-            for dy in range(-debris_size, debris_size + 1):
-                for dx in range(-debris_size, debris_size + 1):
-                    if random.random() < 0.4 / (abs(dx) + abs(dy) + 0.5):  # More likely near center
-                        if (room_y <= debris_y + dy < room_y + room_h and
-                            room_x <= debris_x + dx < room_x + room_w):
-                            self.grid[debris_y + dy][debris_x + dx] = TileType.WALL
+            # Create small debris cluster, more likely near center
+            self.apply_stamp(debris_x, debris_y, RUINS_DEBRIS_STAMPS[debris_size], WALL_TILE,
+                             room_x, room_y, room_x + room_w, room_y + room_h)
     
     def generate_swamp_features(self):
         """Generate swamp-specific features like water and muddy areas with natural patterns"""
         room_x, room_y = 2, 2
         room_w, room_h = self.grid_width - 4, self.grid_height - 4
         
+        # Bind hot lookups once for the loops below
+        grid = self.grid
+        rand, randint, uniform = random.random, random.randint, random.uniform
+        wall, water = WALL_TILE, WATER_TILE
+        
         # Create interconnected water pools with organically shaped edges
-        num_pools = random.randint(3, 5)
+        num_pools = randint(3, 5)
         pool_centers = []
         
         # Place pool centers
         for _ in range(num_pools):
-            pool_x = random.randint(room_x + 4, room_x + room_w - 5)
-            pool_y = random.randint(room_y + 4, room_y + room_h - 5)
-            pool_size = random.randint(4, 7)
+            pool_x = randint(room_x + 4, room_x + room_w - 5)
+            pool_y = randint(room_y + 4, room_y + room_h - 5)
+            pool_size = randint(4, 7)
             pool_centers.append((pool_x, pool_y, pool_size))
         
         # Create organic water pools
         for center_x, center_y, size in pool_centers:
             # Draw irregular pool shape
-            for dy in range(-size, size + 1):
-                for dx in range(-size, size + 1):
-                    # Create oval-like shape with noise
-                    dist = math.sqrt((dx/1.5)**2 + (dy/1.8)**2) + random.uniform(-0.8, 0.8)
-                    
-                    # More likely to place water near center
-                    if (center_y + dy < room_y + room_h - 1 and 
-                        center_x + dx < room_x + room_w - 1 and
-                        center_y + dy >= room_y and center_x + dx >= room_x and
-                        dist <= size * random.uniform(0.5, 0.9)):
-                        self.grid[center_y + dy][center_x + dx] = TileType.WATER
+            for dx, dy, base_dist in SWAMP_POOL_STAMPS[size]:
+                # Create oval-like shape with noise
+                dist = base_dist + uniform(-0.8, 0.8)
+                
+                # More likely to place water near center
+                if (center_y + dy < room_y + room_h - 1 and 
+                    center_x + dx < room_x + room_w - 1 and
+                    center_y + dy >= room_y and center_x + dx >= room_x and
+                    dist <= size * uniform(0.5, 0.9)):
+                    grid[center_y + dy][center_x + dx] = water
         
         # Connect some pools with water channels
         if len(pool_centers) >= 2:
@@ -976,268 +1118,249 @@ class Room:
                 for step in range(steps + 1):
                     # Linear interpolation with random deviation
                     t = step / steps
-                    deviation = random.randint(-3, 3)
+                    deviation = randint(-3, 3)
                     point_x = int(start_x * (1-t) + end_x * t) + deviation
                     point_y = int(start_y * (1-t) + end_y * t) + deviation
                     points.append((point_x, point_y))
                 
-                # Draw the water channel
+                # Draw the water channel, keeping it off the room's outer ring
+                min_x, max_x = room_x + 1, room_x + room_w - 2
+                min_y, max_y = room_y + 1, room_y + room_h - 2
                 for point_x, point_y in points:
-                    if (room_x < point_x < room_x + room_w - 1 and
-                        room_y < point_y < room_y + room_h - 1):
-                        self.grid[point_y][point_x] = TileType.WATER
+                    if min_x <= point_x <= max_x and min_y <= point_y <= max_y:
+                        grid[point_y][point_x] = water
                         
                         # Add width to the channel
-                        for dy in range(-1, 2):
-                            for dx in range(-1, 2):
-                                if random.random() < 0.4:  # 40% chance
-                                    nx, ny = point_x + dx, point_y + dy
-                                    if (room_x < nx < room_x + room_w - 1 and
-                                        room_y < ny < room_y + room_h - 1):
-                                        self.grid[ny][nx] = TileType.WATER
+                        for dx, dy in NEIGHBORHOOD_3X3:
+                            if rand() < 0.4:  # 40% chance
+                                nx, ny = point_x + dx, point_y + dy
+                                if min_x <= nx <= max_x and min_y <= ny <= max_y:
+                                    grid[ny][nx] = water
         
         # Add vegetation (wall tiles) around water
+        near_water_rows = dilate_row_masks([tile_row_mask(row, water) for row in grid])
+        room_cols = ((1 << room_w) - 1) << room_x
         for r_idx in range(room_y, room_y + room_h):
-            for c_idx in range(room_x, room_x + room_w):
-                if self.grid[r_idx][c_idx] == TileType.FLOOR:
-                    # Check if near water
-                    near_water = False
-                    for dy in range(-1, 2):
-                        for dx in range(-1, 2):
-                            ny, nx = r_idx + dy, c_idx + dx
-                            if (0 <= ny < self.grid_height and 0 <= nx < self.grid_width and
-                                self.grid[ny][nx] == TileType.WATER):
-                                near_water = True
-                                break
-                        if near_water:
-                            break
-                    
-                    # Place vegetation near water with higher probability
-                    if near_water and random.random() < 0.3:  # 30% chance
-                        self.grid[r_idx][c_idx] = TileType.WALL
+            near_water = near_water_rows[r_idx] & room_cols
+            
+            # Visit the near-water columns left to right
+            row = grid[r_idx]
+            while near_water:
+                lowest = near_water & -near_water
+                near_water ^= lowest
+                c_idx = lowest.bit_length() - 1
+                
+                # Place vegetation near water with higher probability
+                if row[c_idx] == FLOOR_TILE and rand() < 0.3:  # 30% chance
+                    row[c_idx] = wall
     
     def generate_mountain_features(self):
         """Generate mountain-specific features like rocky outcrops in natural patterns"""
         room_x, room_y = 2, 2
         room_w, room_h = self.grid_width - 4, self.grid_height - 4
         
+        # Bind hot lookups once for the loops below
+        grid = self.grid
+        rand, randint, uniform = random.random, random.randint, random.uniform
+        wall = WALL_TILE
+        inner_right, inner_bottom = room_x + room_w - 1, room_y + room_h - 1
+        
         # Create mountain ridge formations with natural clustering
-        num_formations = random.randint(3, 5)
+        num_formations = randint(3, 5)
         for _ in range(num_formations):
             # Choose starting points for ridge lines
-            ridge_start_x = random.randint(room_x + 2, room_x + room_w - 3)
-            ridge_start_y = random.randint(room_y + 2, room_y + room_h - 3)
+            ridge_start_x = randint(room_x + 2, room_x + room_w - 3)
+            ridge_start_y = randint(room_y + 2, room_y + room_h - 3)
             
             # Ridge length and direction
-            ridge_length = random.randint(5, 10)
-            angle = random.uniform(0, 2 * 3.14159)  # Random angle in radians
+            ridge_length = randint(5, 10)
+            angle = uniform(0, math.tau)  # Random angle in radians
+            step_x, step_y = math.cos(angle), math.sin(angle)
             
             # Draw ridge line
             for i in range(ridge_length):
                 # Calculate position along the ridge with some natural variation
-                dx = int(i * math.cos(angle) + random.uniform(-0.5, 0.5))
-                dy = int(i * math.sin(angle) + random.uniform(-0.5, 0.5))
-                rock_x = ridge_start_x + dx
-                rock_y = ridge_start_y + dy
+                rock_x = ridge_start_x + int(i * step_x + uniform(-0.5, 0.5))
+                rock_y = ridge_start_y + int(i * step_y + uniform(-0.5, 0.5))
                 
                 # Ensure within room bounds
-                if (room_x < rock_x < room_x + room_w - 1 and
-                    room_y < rock_y < room_y + room_h - 1):
-                    self.grid[rock_y][rock_x] = TileType.WALL
+                if room_x < rock_x < inner_right and room_y < rock_y < inner_bottom:
+                    grid[rock_y][rock_x] = wall
                     
                     # Add some smaller rocks around the main ridge
                     for _ in range(2):
-                        scatter_dx = random.randint(-2, 2)
-                        scatter_dy = random.randint(-2, 2)
+                        scatter_dx = randint(-2, 2)
+                        scatter_dy = randint(-2, 2)
                         scatter_x = rock_x + scatter_dx
                         scatter_y = rock_y + scatter_dy
                         
                         # More rocks closer to ridge, fewer further away
-                        if (room_x < scatter_x < room_x + room_w - 1 and
-                            room_y < scatter_y < room_y + room_h - 1 and
-                            random.random() < 0.7 / (abs(scatter_dx) + abs(scatter_dy) + 0.1)):
-                            self.grid[scatter_y][scatter_x] = TileType.WALL
+                        if (room_x < scatter_x < inner_right and
+                            room_y < scatter_y < inner_bottom and
+                            rand() < RIDGE_SCATTER_CHANCES[abs(scatter_dx) + abs(scatter_dy)]):
+                            grid[scatter_y][scatter_x] = wall
         
         # Add boulders (small clusters of rocks)
-        num_boulders = random.randint(4, 8)
+        num_boulders = randint(4, 8)
         for _ in range(num_boulders):
-            boulder_x = random.randint(room_x + 1, room_x + room_w - 3)
-            boulder_y = random.randint(room_y + 1, room_y + room_h - 3)
-            boulder_size = random.randint(2, 4)
-            
-            for dy in range(-boulder_size, boulder_size + 1):
-                for dx in range(-boulder_size, boulder_size + 1):
-                    # Create boulder with circular pattern
-                    distance = math.sqrt(dx**2 + dy**2)
-                    if distance <= boulder_size and random.random() < (boulder_size - distance) / boulder_size:
-                        rock_x = boulder_x + dx
-                        rock_y = boulder_y + dy
-                        if (room_x < rock_x < room_x + room_w - 1 and
-                            room_y < rock_y < room_y + room_h - 1):
-                            self.grid[rock_y][rock_x] = TileType.WALL
+            boulder_x = randint(room_x + 1, room_x + room_w - 3)
+            boulder_y = randint(room_y + 1, room_y + room_h - 3)
+            boulder_size = randint(2, 4)
+            
+            # Create boulder with circular pattern
+            self.apply_stamp(boulder_x, boulder_y, BOULDER_STAMPS[boulder_size], wall,
+                             room_x + 1, room_y + 1, inner_right, inner_bottom)
     
     def add_potential_exits(self):
         """Add potential exit tiles on room edges for infinite generation"""
         # Add exit tiles at multiple positions along each edge for more options
         
         # North edge - add 2-3 exits spaced out
-        num_n_exits = random.randint(2, 3)
-        n_exit_positions = [int(self.grid_width * (i+1)/(num_n_exits+1)) for i in range(num_n_exits)]
-        for pos in n_exit_positions:
-            self.grid[0][pos] = TileType.EXIT
+        for pos in spaced_positions(random.randint(2, 3), self.grid_width):
+            self.grid[0][pos] = EXIT_TILE
         
         # South edge - add 2-3 exits spaced out  
-        num_s_exits = random.randint(2, 3)
-        s_exit_positions = [int(self.grid_width * (i+1)/(num_s_exits+1)) for i in range(num_s_exits)]
-        for pos in s_exit_positions:
-            self.grid[self.grid_height - 1][pos] = TileType.EXIT
+        for pos in spaced_positions(random.randint(2, 3), self.grid_width):
+            self.grid[self.grid_height - 1][pos] = EXIT_TILE
         
         # West edge - add 2-3 exits spaced out
-        num_w_exits = random.randint(2, 3)
-        w_exit_positions = [int(self.grid_height * (i+1)/(num_w_exits+1)) for i in range(num_w_exits)]
-        for pos in w_exit_positions:
-            self.grid[pos][0] = TileType.EXIT
+        for pos in spaced_positions(random.randint(2, 3), self.grid_height):
+            self.grid[pos][0] = EXIT_TILE
         
         # East edge - add 2-3 exits spaced out
-        num_e_exits = random.randint(2, 3)
-        e_exit_positions = [int(self.grid_height * (i+1)/(num_e_exits+1)) for i in range(num_e_exits)]
-        for pos in e_exit_positions:
-            self.grid[pos][self.grid_width - 1] = TileType.EXIT
+        for pos in spaced_positions(random.randint(2, 3), self.grid_height):
+            self.grid[pos][self.grid_width - 1] = EXIT_TILE
             
         # Mark the edge with a special indicator
         # This creates a subtle visual edge without walls
-        for x in range(self.grid_width):
-            # Only mark if it's not already an exit
-            if self.grid[0][x] != TileType.EXIT:
-                self.grid[0][x] = TileType.FLOOR
-            if self.grid[self.grid_height - 1][x] != TileType.EXIT:
-                self.grid[self.grid_height - 1][x] = TileType.FLOOR
-                
-        for y in range(self.grid_height):
-            # Only mark if it's not already an exit
-            if self.grid[y][0] != TileType.EXIT:
-                self.grid[y][0] = TileType.FLOOR
-            if self.grid[y][self.grid_width - 1] != TileType.EXIT:
-                self.grid[y][self.grid_width - 1] = TileType.FLOOR
+        # Only mark tiles that aren't already exits: top and bottom rows are translated whole
+        for row in (self.grid[0], self.grid[self.grid_height - 1]):
+            row[:] = row.translate(EDGE_TILE_TABLE)
+        
+        last_x = self.grid_width - 1
+        for row in self.grid:
+            row[0] = EDGE_TILE_TABLE[row[0]]
+            row[last_x] = EDGE_TILE_TABLE[row[last_x]]
 
     def generate_cave_features(self):
         """Generate cave-specific features like stalactites, water pools"""
         room_x, room_y = 2, 2
         room_w, room_h = self.grid_width - 4, self.grid_height - 4
         
+        # Bind hot lookups once for the loops below
+        grid = self.grid
+        rand, randint, uniform, gauss, choice = random.random, random.randint, random.uniform, random.gauss, random.choice
+        wall, water = WALL_TILE, WATER_TILE
+        # Interior bounds shared by the rock scatter: room_x < x < inner_right, room_y < y < inner_bottom
+        inner_right, inner_bottom = room_x + room_w - 1, room_y + room_h - 1
+        
         # Add rock formations in natural-looking clumps
-        num_formations = random.randint(3, 6)
+        num_formations = randint(3, 6)
         for _ in range(num_formations):
             if room_w > 6 and room_h > 6:
                 # Choose a central point for the formation
-                center_x = random.randint(room_x + 2, room_x + room_w - 3)
-                center_y = random.randint(room_y + 2, room_y + room_h - 3)
+                center_x = randint(room_x + 2, room_x + room_w - 3)
+                center_y = randint(room_y + 2, room_y + room_h - 3)
                 
                 # Create a randomized cluster of rocks around the center
-                formation_size = random.randint(3, 7)
+                formation_size = randint(3, 7)
+                sigma = formation_size / 3
                 for i in range(formation_size * 2):
                     # Calculate position with proximity to center (more likely closer)
-                    dx = int(random.gauss(0, formation_size / 3))
-                    dy = int(random.gauss(0, formation_size / 3))
-                    rock_x = center_x + dx
-                    rock_y = center_y + dy
+                    rock_x = center_x + int(gauss(0, sigma))
+                    rock_y = center_y + int(gauss(0, sigma))
                     
                     # Ensure within room bounds
-                    if (room_x < rock_x < room_x + room_w - 1 and 
-                        room_y < rock_y < room_y + room_h - 1):
-                        self.grid[rock_y][rock_x] = TileType.WALL
+                    if room_x < rock_x < inner_right and room_y < rock_y < inner_bottom:
+                        grid[rock_y][rock_x] = wall
         
         # Add stalactite pillars in corners and edges more naturally
-        num_pillars = random.randint(3, 7)
+        num_pillars = randint(3, 7)
         for _ in range(num_pillars):
             # Pick a position biased toward edges
-            edge_bias = random.choice([0, 1])  # 0 = close to edge, 1 = anywhere
+            edge_bias = choice([0, 1])  # 0 = close to edge, 1 = anywhere
             if edge_bias == 0:
                 # Close to edge
-                if random.choice([True, False]):  # horizontal edge
-                    pillar_x = random.randint(room_x + 1, room_x + room_w - 2)
-                    pillar_y = random.choice([room_y + random.randint(0, 3), 
-                                             room_y + room_h - random.randint(1, 4)])
+                if choice([True, False]):  # horizontal edge
+                    pillar_x = randint(room_x + 1, room_x + room_w - 2)
+                    pillar_y = choice([room_y + randint(0, 3), 
+                                       room_y + room_h - randint(1, 4)])
                 else:  # vertical edge
-                    pillar_x = random.choice([room_x + random.randint(0, 3), 
-                                             room_x + room_w - random.randint(1, 4)])
-                    pillar_y = random.randint(room_y + 1, room_y + room_h - 2)
+                    pillar_x = choice([room_x + randint(0, 3), 
+                                       room_x + room_w - randint(1, 4)])
+                    pillar_y = randint(room_y + 1, room_y + room_h - 2)
             else:
                 # Anywhere in room
-                pillar_x = random.randint(room_x + 1, room_x + room_w - 2)
-                pillar_y = random.randint(room_y + 1, room_y + room_h - 2)
+                pillar_x = randint(room_x + 1, room_x + room_w - 2)
+                pillar_y = randint(room_y + 1, room_y + room_h - 2)
                 
             if 0 <= pillar_y < self.grid_height and 0 <= pillar_x < self.grid_width:
-                self.grid[pillar_y][pillar_x] = TileType.WALL
+                grid[pillar_y][pillar_x] = wall
                 
                 # Add some smaller rocks around the pillar
-                for i in range(random.randint(1, 3)):
-                    dx = random.randint(-1, 1)
-                    dy = random.randint(-1, 1)
-                    nx, ny = pillar_x + dx, pillar_y + dy
-                    if (room_x < nx < room_x + room_w - 1 and 
-                        room_y < ny < room_y + room_h - 1 and
-                        random.random() < 0.6):  # 60% chance
-                        self.grid[ny][nx] = TileType.WALL
+                for i in range(randint(1, 3)):
+                    nx = pillar_x + randint(-1, 1)
+                    ny = pillar_y + randint(-1, 1)
+                    if (room_x < nx < inner_right and 
+                        room_y < ny < inner_bottom and
+                        rand() < 0.6):  # 60% chance
+                        grid[ny][nx] = wall
         
         # Add water pools with more natural, irregular shapes
-        num_pools = random.randint(1, 3)
+        num_pools = randint(1, 3)
         for _ in range(num_pools):
-            pool_x = random.randint(room_x + 1, room_x + room_w - 6)
-            pool_y = random.randint(room_y + 1, room_y + room_h - 6)
-            pool_size = random.randint(3, 5)
+            pool_x = randint(room_x + 1, room_x + room_w - 6)
+            pool_y = randint(room_y + 1, room_y + room_h - 6)
+            pool_size = randint(3, 5)
             
             # Generate organic-looking water pool
-            for dy in range(-1, pool_size + 1):
-                for dx in range(-1, pool_size + 1):
-                    # Calculate distance from center (for oval shape)
-                    dist_from_center = ((dx - pool_size/2)**2 / (pool_size/1.5)**2 + 
-                                       (dy - pool_size/2)**2 / (pool_size/1.8)**2)
-                    
-                    # More likely to place water near center
-                    if (pool_y + dy < room_y + room_h - 1 and 
-                        pool_x + dx < room_x + room_w - 1 and
-                        pool_y + dy >= room_y and pool_x + dx >= room_x and
-                        dist_from_center <= random.uniform(0.3, 0.7)):
-                        self.grid[pool_y + dy][pool_x + dx] = TileType.WATER
+            for dx, dy, dist_from_center in CAVE_POOL_STAMPS[pool_size]:
+                # More likely to place water near center
+                x, y = pool_x + dx, pool_y + dy
+                if (room_y <= y < inner_bottom and room_x <= x < inner_right and
+                    dist_from_center <= uniform(0.3, 0.7)):
+                    grid[y][x] = water
 
     def generate_forest_features(self):
         """Generate forest-specific features like tree groves with natural clustering"""
         room_x, room_y = 2, 2
         room_w, room_h = self.grid_width - 4, self.grid_height - 4
         
+        # Bind hot lookups once for the loops below
+        grid = self.grid
+        rand, randint, gauss, choice = random.random, random.randint, random.gauss, random.choice
+        wall = WALL_TILE
+        inner_right, inner_bottom = room_x + room_w - 1, room_y + room_h - 1
+        bush_offsets = (-1, 0, 1)
+        
         # Create forest tree clusters with natural patterns
-        num_groves = random.randint(3, 6)  # More tree groves
+        num_groves = randint(3, 6)  # More tree groves
         for _ in range(num_groves):
             # Choose a central point for the grove
-            center_x = random.randint(room_x + 3, room_x + room_w - 4)
-            center_y = random.randint(room_y + 3, room_y + room_h - 4)
+            center_x = randint(room_x + 3, room_x + room_w - 4)
+            center_y = randint(room_y + 3, room_y + room_h - 4)
             
             # Use Gaussian distribution for natural-looking clusters
-            grove_size = random.randint(3, 6)  # Larger groves
+            grove_size = randint(3, 6)  # Larger groves
             num_trees = grove_size * 3  # More trees per grove
+            sigma = grove_size / 2.5
             
             for _ in range(num_trees):
                 # Trees are more likely to be near the center of the grove
-                dx = int(random.gauss(0, grove_size / 2.5))
-                dy = int(random.gauss(0, grove_size / 2.5))
-                tree_x = center_x + dx
-                tree_y = center_y + dy
+                tree_x = center_x + int(gauss(0, sigma))
+                tree_y = center_y + int(gauss(0, sigma))
                 
                 # Ensure within room bounds
-                if (room_x < tree_x < room_x + room_w - 1 and
-                    room_y < tree_y < room_y + room_h - 1):
-                    self.grid[tree_y][tree_x] = TileType.WALL
+                if room_x < tree_x < inner_right and room_y < tree_y < inner_bottom:
+                    grid[tree_y][tree_x] = wall
                     
                     # Occasionally add smaller bushes around trees
-                    if random.random() < 0.3:  # 30% chance for bushes
-                        bush_dx = random.choice([-1, 0, 1])
-                        bush_dy = random.choice([-1, 0, 1])
-                        bush_x = tree_x + bush_dx
-                        bush_y = tree_y + bush_dy
-                        if (room_x < bush_x < room_x + room_w - 1 and
-                            room_y < bush_y < room_y + room_h - 1):
-                            self.grid[bush_y][bush_x] = TileType.WALL
+                    if rand() < 0.3:  # 30% chance for bushes
+                        bush_x = tree_x + choice(bush_offsets)
+                        bush_y = tree_y + choice(bush_offsets)
+                        if room_x < bush_x < inner_right and room_y < bush_y < inner_bottom:
+                            grid[bush_y][bush_x] = wall
+
 
     def generate_dungeon_features(self):
         """Generate dungeon-specific features like chambers and corridors with realistic wall patterns"""
@@ -1246,7 +1369,7 @@ class Room:
         
         # Create small chambers with varying architectural styles
         num_chambers = random.randint(2, 3)
-        chambers = []
+        chamber_centers = []  # (x, y) of each chamber, in placement order, for the corridors
         
         for _ in range(num_chambers):
             chamber_w = random.randint(5, 8)
@@ -1254,73 +1377,58 @@ class Room:
             chamber_x = random.randint(room_x + 2, room_x + room_w - chamber_w - 2)
             chamber_y = random.randint(room_y + 2, room_y + room_h - chamber_h - 2)
             
-            # Create chamber walls with occasional crumbling sections
-            for dy in range(chamber_h):
-                for dx in range(chamber_w):
-                    if (dy == 0 or dy == chamber_h - 1 or dx == 0 or dx == chamber_w - 1):
-                        # Add wall with occasional gaps for "crumbling" effect
-                        if chamber_y + dy < self.grid_height and chamber_x + dx < self.grid_width:
-                            # Corners are always walls
-                            if (dy == 0 and dx == 0) or (dy == 0 and dx == chamber_w - 1) or \
-                               (dy == chamber_h - 1 and dx == 0) or (dy == chamber_h - 1 and dx == chamber_w - 1):
-                                self.grid[chamber_y + dy][chamber_x + dx] = TileType.WALL
-                            # Other edge tiles have a small chance to be floor (crumbling effect)
-                            elif random.random() < 0.9:  # 90% chance to be wall
-                                self.grid[chamber_y + dy][chamber_x + dx] = TileType.WALL
-                                
-                                # Occasionally add rubble next to walls
-                                if random.random() < 0.2:
-                                    rubble_dx = -1 if dx == 0 else (1 if dx == chamber_w - 1 else 0)
-                                    rubble_dy = -1 if dy == 0 else (1 if dy == chamber_h - 1 else 0)
-                                    rubble_x = chamber_x + dx + rubble_dx
-                                    rubble_y = chamber_y + dy + rubble_dy
-                                    if (room_x < rubble_x < room_x + room_w - 1 and
-                                        room_y < rubble_y < room_y + room_h - 1):
-                                        self.grid[rubble_y][rubble_x] = TileType.WALL
+            # Corners are always walls
+            for x in (chamber_x, chamber_x + chamber_w - 1):
+                for y in (chamber_y, chamber_y + chamber_h - 1):
+                    if y < self.grid_height and x < self.grid_width:
+                        self.grid[y][x] = WALL_TILE
+            
+            # Create the rest of the chamber walls with occasional crumbling sections
+            for x, y, rubble_dx, rubble_dy in rect_edge_cells(chamber_x, chamber_y, chamber_w, chamber_h):
+                # Other edge tiles have a small chance to be floor (crumbling effect)
+                if y < self.grid_height and x < self.grid_width and random.random() < 0.9:  # 90% chance to be wall
+                    self.grid[y][x] = WALL_TILE
+                    
+                    # Occasionally add rubble next to walls, just outside the chamber
+                    if random.random() < 0.2:
+                        rubble_x = x + rubble_dx
+                        rubble_y = y + rubble_dy
+                        if (room_x < rubble_x < room_x + room_w - 1 and
+                            room_y < rubble_y < room_y + room_h - 1):
+                            self.grid[rubble_y][rubble_x] = WALL_TILE
             
             # Add entrance to chamber
             entrance_side = random.choice(['top', 'bottom', 'left', 'right'])
             if entrance_side == 'top' and chamber_y > room_y:
-                self.grid[chamber_y][chamber_x + chamber_w // 2] = TileType.FLOOR
-                self.grid[chamber_y][chamber_x + chamber_w // 2 - 1] = TileType.FLOOR  # Wider entrance
+                self.grid[chamber_y][chamber_x + chamber_w // 2] = FLOOR_TILE
+                self.grid[chamber_y][chamber_x + chamber_w // 2 - 1] = FLOOR_TILE  # Wider entrance
             elif entrance_side == 'bottom' and chamber_y + chamber_h < room_y + room_h:
-                self.grid[chamber_y + chamber_h - 1][chamber_x + chamber_w // 2] = TileType.FLOOR
-                self.grid[chamber_y + chamber_h - 1][chamber_x + chamber_w // 2 + 1] = TileType.FLOOR  # Wider entrance
+                self.grid[chamber_y + chamber_h - 1][chamber_x + chamber_w // 2] = FLOOR_TILE
+                self.grid[chamber_y + chamber_h - 1][chamber_x + chamber_w // 2 + 1] = FLOOR_TILE  # Wider entrance
             elif entrance_side == 'left' and chamber_x > room_x:
-                self.grid[chamber_y + chamber_h // 2][chamber_x] = TileType.FLOOR
-                self.grid[chamber_y + chamber_h // 2 + 1][chamber_x] = TileType.FLOOR  # Taller entrance
+                self.grid[chamber_y + chamber_h // 2][chamber_x] = FLOOR_TILE
+                self.grid[chamber_y + chamber_h // 2 + 1][chamber_x] = FLOOR_TILE  # Taller entrance
             elif entrance_side == 'right' and chamber_x + chamber_w < room_x + room_w:
-                self.grid[chamber_y + chamber_h // 2][chamber_x + chamber_w - 1] = TileType.FLOOR
-                self.grid[chamber_y + chamber_h // 2 - 1][chamber_x + chamber_w - 1] = TileType.FLOOR  # Taller entrance
+                self.grid[chamber_y + chamber_h // 2][chamber_x + chamber_w - 1] = FLOOR_TILE
+                self.grid[chamber_y + chamber_h // 2 - 1][chamber_x + chamber_w - 1] = FLOOR_TILE  # Taller entrance
                 
-            chambers.append((chamber_x, chamber_y, chamber_w, chamber_h, entrance_side))
-        
-        # Add connecting corridors between chambers
-        if len(chambers) >= 2:
-            for i in range(len(chambers) - 1):
-                start_chamber = chambers[i]
-                end_chamber = chambers[i + 1]
-                
-                # Find corridor path (simple implementation)
-                start_x = start_chamber[0] + start_chamber[2] // 2
-                start_y = start_chamber[1] + start_chamber[3] // 2
-                end_x = end_chamber[0] + end_chamber[2] // 2
-                end_y = end_chamber[1] + end_chamber[3] // 2
-                
-                # Create horizontal then vertical corridor
-                current_x = start_x
-                while current_x != end_x:
-                    step = 1 if current_x < end_x else -1
-                    current_x += step
-                    if room_x < current_x < room_x + room_w and room_y < start_y < room_y + room_h:
-                        self.grid[start_y][current_x] = TileType.FLOOR
-                
-                current_y = start_y
-                while current_y != end_y:
-                    step = 1 if current_y < end_y else -1
-                    current_y += step
-                    if room_x < end_x < room_x + room_w and room_y < current_y < room_y + room_h:
-                        self.grid[current_y][end_x] = TileType.FLOOR
+            chamber_centers.append((chamber_x + chamber_w // 2, chamber_y + chamber_h // 2))
+        
+        # Add connecting corridors between consecutive chambers
+        for (start_x, start_y), (end_x, end_y) in zip(chamber_centers, chamber_centers[1:]):
+            # Find corridor path (simple implementation)
+            # Create horizontal then vertical corridor; each leg leaves its starting tile as is
+            # and is clipped to the room interior up front
+            if room_y < start_y < room_y + room_h:
+                x_lo, x_hi = (start_x + 1, end_x) if start_x < end_x else (end_x, start_x - 1)
+                x_lo, x_hi = max(x_lo, room_x + 1), min(x_hi, room_x + room_w - 1)
+                if x_lo <= x_hi:
+                    self.grid[start_y][x_lo:x_hi + 1] = bytes((FLOOR_TILE,)) * (x_hi - x_lo + 1)
+            
+            if room_x < end_x < room_x + room_w:
+                y_lo, y_hi = (start_y + 1, end_y) if start_y < end_y else (end_y, start_y - 1)
+                for current_y in range(max(y_lo, room_y + 1), min(y_hi, room_y + room_h - 1) + 1):
+                    self.grid[current_y][end_x] = FLOOR_TILE
 
     def generate_village_features(self):
         """Generate village-specific features like building foundations with natural layouts"""
@@ -1331,30 +1439,21 @@ class Room:
         path_width = 3
         path_direction = random.choice(["horizontal", "vertical", "cross"])
         
+        # The path runs from -path_width // 2 to path_width // 2 either side of its center line
+        path_offset = -path_width // 2
+        path_span = path_width // 2 - path_offset + 1
         if path_direction == "horizontal":
             path_y = room_y + room_h // 2
-            for x in range(room_x, room_x + room_w):
-                for dy in range(-path_width // 2, path_width // 2 + 1):
-                    if 0 <= path_y + dy < self.grid_height:
-                        # Make sure path is floor (road through village)
-                        self.grid[path_y + dy][x] = TileType.FLOOR
+            # Make sure path is floor (road through village)
+            self.fill_rect(room_x, path_y + path_offset, room_w, path_span, FLOOR_TILE)
         elif path_direction == "vertical":
             path_x = room_x + room_w // 2
-            for y in range(room_y, room_y + room_h):
-                for dx in range(-path_width // 2, path_width // 2 + 1):
-                    if 0 <= path_x + dx < self.grid_width:
-                        self.grid[y][path_x + dx] = TileType.FLOOR
+            self.fill_rect(path_x + path_offset, room_y, path_span, room_h, FLOOR_TILE)
         else:  # Cross pattern
             path_x = room_x + room_w // 2
             path_y = room_y + room_h // 2
-            for y in range(room_y, room_y + room_h):
-                for dx in range(-path_width // 2, path_width // 2 + 1):
-                    if 0 <= path_x + dx < self.grid_width:
-                        self.grid[y][path_x + dx] = TileType.FLOOR
-            for x in range(room_x, room_x + room_w):
-                for dy in range(-path_width // 2, path_width // 2 + 1):
-                    if 0 <= path_y + dy < self.grid_height:
-                        self.grid[path_y + dy][x] = TileType.FLOOR
+            self.fill_rect(path_x + path_offset, room_y, path_span, room_h, FLOOR_TILE)
+            self.fill_rect(room_x, path_y + path_offset, room_w, path_span, FLOOR_TILE)
         
         # Create buildings in a more natural village layout with different sizes
         building_zones = []
@@ -1390,11 +1489,7 @@ class Room:
                 building_y = random.randint(zone_y + 1, zone_y + zone_h - building_h - 1)
                 
                 # Create building outline with variations
-                for dy in range(building_h):
-                    for dx in range(building_w):
-                        if (dy == 0 or dy == building_h - 1 or dx == 0 or dx == building_w - 1):
-                            if building_y + dy < self.grid_height and building_x + dx < self.grid_width:
-                                self.grid[building_y + dy][building_x + dx] = TileType.WALL
+                self.outline_rect(building_x, building_y, building_w, building_h, WALL_TILE)
                 
                 # Add door facing path or in random position
                 door_side = random.choice(["north", "south", "east", "west"])
@@ -1417,7 +1512,7 @@ class Room:
                     door_y = building_y + building_h - 1
                 
                 if door_y < self.grid_height and door_x < self.grid_width:
-                    self.grid[door_y][door_x] = TileType.FLOOR
+                    self.grid[door_y][door_x] = FLOOR_TILE
                 
                 # Internal features
                 if random.random() < 0.4 and building_w > 5 and building_h > 4:  # 40% chance for internal walls
@@ -1426,12 +1521,12 @@ class Room:
                     for internal_y in range(building_y + 1, building_y + building_h - 1):
                         if internal_y < self.grid_height and wall_x < self.grid_width:
                             if random.random() < 0.7:  # 70% chance for wall segment
-                                self.grid[internal_y][wall_x] = TileType.WALL
+                                self.grid[internal_y][wall_x] = WALL_TILE
                     
                     # Add door in internal wall
                     door_y = building_y + 1 + random.randint(1, building_h - 3)
                     if door_y < self.grid_height and wall_x < self.grid_width:
-                        self.grid[door_y][wall_x] = TileType.FLOOR
+                        self.grid[door_y][wall_x] = FLOOR_TILE
         
         # Add small decoration elements (fences, wells, gardens)
         num_decorations = random.randint(3, 8)
@@ -1440,19 +1535,19 @@ class Room:
             decor_y = random.randint(room_y + 1, room_y + room_h - 3)
             decor_type = random.choice(["well", "garden", "fence"])
             
-            if decor_type == "well" and self.grid[decor_y][decor_x] == TileType.FLOOR:
+            if decor_type == "well" and self.grid[decor_y][decor_x] == FLOOR_TILE:
                 # Well (small water surrounded by wall)
-                self.grid[decor_y][decor_x] = TileType.WATER
+                self.grid[decor_y][decor_x] = WATER_TILE
                 for dy in range(-1, 2):
                     for dx in range(-1, 2):
                         if abs(dx) + abs(dy) == 2:  # Diagonal corners
                             nx, ny = decor_x + dx, decor_y + dy
                             if (room_x < nx < room_x + room_w - 1 and
                                 room_y < ny < room_y + room_h - 1 and
-                                self.grid[ny][nx] == TileType.FLOOR):
-                                self.grid[ny][nx] = TileType.WALL
+                                self.grid[ny][nx] == FLOOR_TILE):
+                                self.grid[ny][nx] = WALL_TILE
             
-            elif decor_type == "garden" and self.grid[decor_y][decor_x] == TileType.FLOOR:
+            elif decor_type == "garden" and self.grid[decor_y][decor_x] == FLOOR_TILE:
                 # Small garden plot (2x2 or 3x2)
                 garden_w = random.randint(2, 3)
                 garden_h = 2
@@ -1461,12 +1556,12 @@ class Room:
                         nx, ny = decor_x + dx, decor_y + dy
                         if (room_x < nx < room_x + room_w - 1 and
                             room_y < ny < room_y + room_h - 1 and
-                            self.grid[ny][nx] == TileType.FLOOR):
+                            self.grid[ny][nx] == FLOOR_TILE):
                             # 50% chance for wall (representing crops/plants)
                             if random.random() < 0.5:
-                                self.grid[ny][nx] = TileType.WALL
+                                self.grid[ny][nx] = WALL_TILE
             
-            elif decor_type == "fence" and self.grid[decor_y][decor_x] == TileType.FLOOR:
+            elif decor_type == "fence" and self.grid[decor_y][decor_x] == FLOOR_TILE:
                 # Small fence line
                 fence_length = random.randint(3, 5)
                 direction = random.choice([(0, 1), (1, 0)])  # Vertical or horizontal
@@ -1476,9 +1571,9 @@ class Room:
                     nx, ny = decor_x + dx * i, decor_y + dy * i
                     if (room_x < nx < room_x + room_w - 1 and
                         room_y < ny < room_y + room_h - 1 and
-                        self.grid[ny][nx] == TileType.FLOOR and
+                        self.grid[ny][nx] == FLOOR_TILE and
                         random.random() < 0.8):  #  80% chance per segment (gaps in fence)
-                        self.grid[ny][nx] = TileType.WALL
+                        self.grid[ny][nx] = WALL_TILE
 
     def generate_generic_features(self):
         """Generate more interesting generic room features"""
@@ -1503,13 +1598,12 @@ class Room:
                         # Ensure we're not placing pillars on the edge
                         if (1 < pillar_x < self.grid_width - 2 and 
                             1 < pillar_y < self.grid_height - 2):
-                            self.grid[pillar_y][pillar_x] = TileType.WALL
+                            self.grid[pillar_y][pillar_x] = WALL_TILE
                             
                             # Sometimes create pillar clusters
                             if random.random() < 0.3:  # 30% chance for a cluster
-                                for dx, dy in [(1, 0), (0, 1), (1, 1), (-1, 0), (0, -1)]:
-                                    if random.random() < 0.5 and 1 < pillar_x + dx < self.grid_width - 2 and 1 < pillar_y + dy < self.grid_height - 2:
-                                        self.grid[pillar_y + dy][pillar_x + dx] = TileType.WALL
+                                self.apply_stamp(pillar_x, pillar_y, PILLAR_CLUSTER_STAMP, WALL_TILE,
+                                                 2, 2, self.grid_width - 2, self.grid_height - 2)
         
         elif dominant_feature == 'maze':
             # Create partial maze-like features
@@ -1517,19 +1611,19 @@ class Room:
             start_y = room_y + random.randint(3, 8)
             
             # Generate a small maze section
-            directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+            max_x, max_y = self.grid_width - 4, self.grid_height - 4
             for _ in range(20):  # Create 20 wall segments
                 wall_length = random.randint(3, 8)
-                dx, dy = random.choice(directions)
+                dx, dy = random.choice(NEIGHBORS4)
                 
-                for i in range(wall_length):
-                    wall_x = start_x + dx * i
-                    wall_y = start_y + dy * i
-                    
-                    # Ensure we don't place walls at room edges
-                    if (2 < wall_x < self.grid_width - 3 and 
-                        2 < wall_y < self.grid_height - 3):
-                        self.grid[wall_y][wall_x] = TileType.WALL
+                # Each segment is a straight line, so paint it as a one-tile-wide rectangle
+                end_x = start_x + dx * (wall_length - 1)
+                end_y = start_y + dy * (wall_length - 1)
+                
+                # Ensure we don't place walls at room edges
+                left, right = max(3, min(start_x, end_x)), min(max_x, max(start_x, end_x))
+                top, bottom = max(3, min(start_y, end_y)), min(max_y, max(start_y, end_y))
+                self.fill_rect(left, top, right - left + 1, bottom - top + 1, WALL_TILE)
                 
                 # Update starting position for next wall segment
                 start_x += dx * wall_length
@@ -1548,30 +1642,26 @@ class Room:
                 chamber_x = random.randint(room_x + 2, room_x + room_w - chamber_w - 2)
                 chamber_y = random.randint(room_y + 2, room_y + room_h - chamber_h - 2)
                 
-                # Create chamber walls
-                for dy in range(chamber_h):
-                    for dx in range(chamber_w):
-                        if (dx == 0 or dx == chamber_w - 1 or dy == 0 or dy == chamber_h - 1):
-                            # Add some gaps for doorways
-                            if not (dx == chamber_w // 2 and dy == 0) and not (dx == chamber_w // 2 and dy == chamber_h - 1):
-                                if chamber_y + dy < self.grid_height and chamber_x + dx < self.grid_width:
-                                    self.grid[chamber_y + dy][chamber_x + dx] = TileType.WALL
+                # Create chamber walls, with some gaps for doorways
+                door_x = chamber_x + chamber_w // 2
+                self.outline_rect(chamber_x, chamber_y, chamber_w, chamber_h, WALL_TILE,
+                                  gaps=((door_x, chamber_y), (door_x, chamber_y + chamber_h - 1)))
                 
                 # Add some interesting features inside chambers
                 feature = random.choice(['water', 'chest', 'pillar'])
                 if feature == 'water' and chamber_w > 4 and chamber_h > 4:
                     water_x = chamber_x + chamber_w // 2
                     water_y = chamber_y + chamber_h // 2
-                    self.grid[water_y][water_x] = TileType.WATER
+                    self.grid[water_y][water_x] = WATER_TILE
                 elif feature == 'chest' and chamber_w > 4 and chamber_h > 4:
                     chest_x = chamber_x + chamber_w // 2
                     chest_y = chamber_y + chamber_h // 2
-                    self.grid[chest_y][chest_x] = TileType.CHEST
+                    self.grid[chest_y][chest_x] = CHEST_TILE
                 elif feature == 'pillar' and chamber_w > 5 and chamber_h > 5:
                     for i in range(2):
                         pillar_x = chamber_x + random.randint(2, chamber_w - 3)
                         pillar_y = chamber_y + random.randint(2, chamber_h - 3)
-                        self.grid[pillar_y][pillar_x] = TileType.WALL
+                        self.grid[pillar_y][pillar_x] = WALL_TILE
         
         elif dominant_feature == 'asymmetric':
             # Create an asymmetric layout with a large feature to one side
@@ -1583,13 +1673,9 @@ class Room:
                 feature_x = room_x + random.randint(5, room_w - 20)
                 feature_w = random.randint(15, room_w - feature_x - 5)
                 
-                # Create a large wall section
-                for dy in range(feature_h):
-                    for dx in range(feature_w):
-                        if (dx == 0 or dx == feature_w - 1 or dy == 0 or dy == feature_h - 1):
-                            # Add doorways
-                            if not (dx == feature_w // 2 and dy == feature_h - 1):
-                                self.grid[feature_y + dy][feature_x + dx] = TileType.WALL
+                # Create a large wall section, with a doorway on its south side
+                self.outline_rect(feature_x, feature_y, feature_w, feature_h, WALL_TILE,
+                                  gaps=((feature_x + feature_w // 2, feature_y + feature_h - 1),))
                 
             elif side == 'south':
                 feature_h = random.randint(4, 8)
@@ -1597,13 +1683,9 @@ class Room:
                 feature_x = room_x + random.randint(5, room_w - 20)
                 feature_w = random.randint(15, room_w - feature_x - 5)
                 
-                # Create a large wall section
-                for dy in range(feature_h):
-                    for dx in range(feature_w):
-                        if (dx == 0 or dx == feature_w - 1 or dy == 0 or dy == feature_h - 1):
-                            # Add doorways
-                            if not (dx == feature_w // 2 and dy == 0):
-                                self.grid[feature_y + dy][feature_x + dx] = TileType.WALL
+                # Create a large wall section, with a doorway on its north side
+                self.outline_rect(feature_x, feature_y, feature_w, feature_h, WALL_TILE,
+                                  gaps=((feature_x + feature_w // 2, feature_y),))
             
             # Add some random natural features in the remaining space
             num_features = random.randint(8, 15)
@@ -1612,15 +1694,15 @@ class Room:
                 feature_y = random.randint(room_y + 2, room_y + room_h - 3)
                 
                 # Check if this position is away from our main feature
-                if self.grid[feature_y][feature_x] == TileType.FLOOR:
+                if self.grid[feature_y][feature_x] == FLOOR_TILE:
                     feature_type = random.choice(['wall', 'water', 'chest'])
                     
                     if feature_type == 'wall':
-                        self.grid[feature_y][feature_x] = TileType.WALL
+                        self.grid[feature_y][feature_x] = WALL_TILE
                     elif feature_type == 'water':
-                        self.grid[feature_y][feature_x] = TileType.WATER
+                        self.grid[feature_y][feature_x] = WATER_TILE
                     elif feature_type == 'chest':
-                        self.grid[feature_y][feature_x] = TileType.CHEST
+                        self.grid[feature_y][feature_x] = CHEST_TILE
         
         elif dominant_feature == 'island':
             # Create one or more island features in a sea of water
@@ -1629,51 +1711,47 @@ class Room:
             
             # Create the water around the edges
             water_margin = random.randint(3, 6)
+            # Water in a ring pattern: every room tile further than island_reach from the center
+            # in x or y, which leaves a square island and makes each row at most two runs of water
+            island_reach = min(room_w, room_h) // 2 - water_margin
+            room_right = room_x + room_w
+            island_left = min(max(room_x, center_x - island_reach), room_right)
+            island_right = max(min(room_right, center_x + island_reach + 1), island_left)
+            water_row = bytes((WATER_TILE,)) * room_w
             for y in range(room_y, room_y + room_h):
-                for x in range(room_x, room_x + room_w):
-                    # Calculate distance from center
-                    dist_x = abs(x - center_x)
-                    dist_y = abs(y - center_y)
-                    
-                    # Create water in a ring pattern
-                    if max(dist_x, dist_y) > min(room_w, room_h) // 2 - water_margin:
-                        self.grid[y][x] = TileType.WATER
+                row = self.grid[y]
+                if abs(y - center_y) > island_reach:
+                    row[room_x:room_right] = water_row
+                else:
+                    row[room_x:island_left] = water_row[:island_left - room_x]
+                    row[island_right:room_right] = water_row[:room_right - island_right]
             
             # Create bridges across the water in the cardinal directions
             bridges = random.sample(['north', 'south', 'east', 'west'], k=random.randint(2, 4))
             bridge_width = random.randint(2, 3)
             
+            # Each bridge spans bridge_width // 2 tiles either side of the center line
+            bridge_start = bridge_width // 2
+            bridge_span = 2 * bridge_start + 1
             for direction in bridges:
                 if direction == 'north':
-                    for x in range(center_x - bridge_width // 2, center_x + bridge_width // 2 + 1):
-                        for y in range(0, center_y):
-                            if 0 <= x < self.grid_width and 0 <= y < self.grid_height:
-                                self.grid[y][x] = TileType.FLOOR
+                    self.fill_rect(center_x - bridge_start, 0, bridge_span, center_y, FLOOR_TILE)
                 
                 elif direction == 'south':
-                    for x in range(center_x - bridge_width // 2, center_x + bridge_width // 2 + 1):
-                        for y in range(center_y, self.grid_height):
-                            if 0 <= x < self.grid_width and 0 <= y < self.grid_height:
-                                self.grid[y][x] = TileType.FLOOR
+                    self.fill_rect(center_x - bridge_start, center_y, bridge_span, self.grid_height - center_y, FLOOR_TILE)
                 
                 elif direction == 'west':
-                    for y in range(center_y - bridge_width // 2, center_y + bridge_width // 2 + 1):
-                        for x in range(0, center_x):
-                            if 0 <= x < self.grid_width and 0 <= y < self.grid_height:
-                                self.grid[y][x] = TileType.FLOOR
+                    self.fill_rect(0, center_y - bridge_start, center_x, bridge_span, FLOOR_TILE)
                 
                 elif direction == 'east':
-                    for y in range(center_y - bridge_width // 2, center_y + bridge_width // 2 + 1):
-                        for x in range(center_x, self.grid_width):
-                            if 0 <= x < self.grid_width and 0 <= y < self.grid_height:
-                                self.grid[y][x] = TileType.FLOOR
+                    self.fill_rect(center_x, center_y - bridge_start, self.grid_width - center_x, bridge_span, FLOOR_TILE)
             
             # Add some decorative elements on the central island
             island_radius = min(room_w, room_h) // 2 - water_margin - 1
             num_decorations = random.randint(3, 7)
             
             for _ in range(num_decorations):
-                angle = random.uniform(0, 2 * math.pi)
+                angle = random.uniform(0, math.tau)
                 distance = random.uniform(0, island_radius * 0.7)
                 
                 dec_x = int(center_x + distance * math.cos(angle))
@@ -1683,61 +1761,32 @@ class Room:
                     decoration_type = random.choice(['wall', 'chest', 'wall_cluster'])
                     
                     if decoration_type == 'wall':
-                        self.grid[dec_y][dec_x] = TileType.WALL
+                        self.grid[dec_y][dec_x] = WALL_TILE
                     elif decoration_type == 'chest':
-                        self.grid[dec_y][dec_x] = TileType.CHEST
+                        self.grid[dec_y][dec_x] = CHEST_TILE
                     elif decoration_type == 'wall_cluster':
-                        self.grid[dec_y][dec_x] = TileType.WALL
-                        for dx, dy in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
-                            if random.random() < 0.7:
-                                nx, ny = dec_x + dx, dec_y + dy
-                                if 1 <= nx < self.grid_width - 1 and 1 <= ny < self.grid_height - 1:
-                                    self.grid[ny][nx] = TileType.WALL
-            
-        # Add some random objects regardless of dominant feature
-        num_objects = random.randint(5, 10)
-        for _ in range(num_objects):
-            obj_x = random.randint(room_x + 3, room_x + room_w - 4)
-            obj_y = random.randint(room_y + 3, room_y + room_h - 4)
+                        self.place_wall_cluster(dec_x, dec_y)
             
+        # Add some random objects regardless of dominant feature, drawing every
+        # position and object type up front
+        num_objects = random.randint(5, 10)
+        randint = random.randint
+        grid = self.grid
+        positions = [(randint(room_x + 3, room_x + room_w - 4), randint(room_y + 3, room_y + room_h - 4))
+                     for _ in range(num_objects)]
+        object_tiles = random.choices(RANDOM_OBJECT_TILES, weights=RANDOM_OBJECT_WEIGHTS, k=num_objects)
+        for (obj_x, obj_y), tile in zip(positions, object_tiles):
             # Only place on floor tiles
-            if self.grid[obj_y][obj_x] == TileType.FLOOR:
-                obj_type = random.choices(
-                    ['wall', 'water', 'chest', 'wall_cluster'], 
-                    weights=[0.5, 0.3, 0.1, 0.1], 
-                    k=1
-                )[0];
-                
-                if obj_type == 'wall':
-                    self.grid[obj_y][obj_x] = TileType.WALL
-                elif obj_type == 'water':
-                    self.grid[obj_y][obj_x] = TileType.WATER
-
-                elif obj_type == 'chest':
-                    self.grid[obj_y][obj_x] = TileType.CHEST
-                elif obj_type == 'wall_cluster':
-                    self.grid[obj_y][obj_x] = TileType.WALL
-                    for dx, dy in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
-                        if random.random() < 0.7:
-                            nx, ny = obj_x + dx, obj_y + dy
-                            if 1 <= nx < self.grid_width - 1 and 1 <= ny < self.grid_height - 1:
-                                self.grid[ny][nx] = TileType.WALL
+            if grid[obj_y][obj_x] == FLOOR_TILE:
+                if tile is None:
+                    self.place_wall_cluster(obj_x, obj_y)
+                else:
+                    grid[obj_y][obj_x] = tile
 
 
     def add_item(self, item: Item):
-        # Find a random floor tile to place the item
-        possible_locations = []
-        for r_idx, row in enumerate(self.grid):
-            for c_idx, tile in enumerate(row):
-                if tile == TileType.FLOOR:
-                    # Check if location is already occupied by another item
-                    occupied = False
-                    for existing_item in self.items:
-                        if existing_item.x == c_idx and existing_item.y == r_idx:
-                            occupied = True
-                            break
-                    if not occupied:
-                        possible_locations.append((c_idx, r_idx))
+        # Find a random floor tile to place the item, not already occupied by another item
+        possible_locations = self.free_floor_tiles(avoid_npcs=False, avoid_enemies=False)
         
         if possible_locations:
             item.x, item.y = random.choice(possible_locations)
@@ -1745,20 +1794,7 @@ class Room:
 
     def add_npc(self, npc: NPC):
         # Find a random floor tile for NPC, similar to items
-        possible_locations = []
-        for r_idx, row in enumerate(self.grid):
-            for c_idx, tile in enumerate(row):
-                if tile == TileType.FLOOR:
-                    occupied = False
-                    for existing_item in self.items: # Check against items
-                        if existing_item.x == c_idx and existing_item.y == r_idx:
-                            occupied = True; break
-                    if occupied: continue
-                    for existing_npc in self.npcs: # Check against other NPCs
-                        if existing_npc.rect.colliderect(pygame.Rect(c_idx * TILE_SIZE, r_idx * TILE_SIZE, TILE_SIZE, TILE_SIZE)):
-                            occupied = True; break
-                    if not occupied:
-                        possible_locations.append((c_idx, r_idx))
+        possible_locations = self.free_floor_tiles(avoid_npcs=True, avoid_enemies=False)
         
         if possible_locations:
             npc_tile_x, npc_tile_y = random.choice(possible_locations)
@@ -1767,33 +1803,161 @@ class Room:
 
     def add_enemy(self, enemy: Enemy):
         """Add an enemy to the room, placing it on a random floor tile"""
-        possible_locations = []
-        for r_idx, row in enumerate(self.grid):
-            for c_idx, tile in enumerate(row):
-                if tile == TileType.FLOOR:
-                    occupied = False
-                    # Check against items
-                    for existing_item in self.items:
-                        if existing_item.x == c_idx and existing_item.y == r_idx:
-                            occupied = True; break
-                    if occupied: continue
-                    # Check against NPCs
-                    for existing_npc in self.npcs:
-                        if existing_npc.rect.colliderect(pygame.Rect(c_idx * TILE_SIZE, r_idx * TILE_SIZE, TILE_SIZE, TILE_SIZE)):
-                            occupied = True; break
-                    if occupied: continue
-                    # Check against other enemies
-                    for existing_enemy in self.enemies:
-                        if existing_enemy.rect.colliderect(pygame.Rect(c_idx * TILE_SIZE, r_idx * TILE_SIZE, TILE_SIZE, TILE_SIZE)):
-                            occupied = True; break
-                    if not occupied:
-                        possible_locations.append((c_idx, r_idx))
+        possible_locations = self.free_floor_tiles(avoid_npcs=True, avoid_enemies=True)
         
         if possible_locations:
             enemy_tile_x, enemy_tile_y = random.choice(possible_locations)
             enemy.rect.topleft = (enemy_tile_x * TILE_SIZE, enemy_tile_y * TILE_SIZE)
             self.enemies.append(enemy)
 
+    def occupied_tiles(self, avoid_npcs: bool, avoid_enemies: bool) -> set:
+        """Get the (x, y) tiles holding an item or overlapped by an NPC or enemy rect"""
+        occupied = {(item.x, item.y) for item in self.items}
+        entities = (self.npcs if avoid_npcs else []) + (self.enemies if avoid_enemies else [])
+        for entity in entities:
+            rect = entity.rect
+            if rect.width <= 0 or rect.height <= 0:
+                continue  # Empty rects overlap nothing
+            for y in range(rect.top // TILE_SIZE, (rect.bottom - 1) // TILE_SIZE + 1):
+                for x in range(rect.left // TILE_SIZE, (rect.right - 1) // TILE_SIZE + 1):
+                    occupied.add((x, y))
+        return occupied
+
+    def get_floor_tiles(self) -> List[Tuple[int, int]]:
+        """Get the (x, y) positions of every floor tile in row-major order"""
+        if self.floor_tiles is None:
+            floor = FLOOR_TILE
+            self.floor_tiles = [(c_idx, r_idx) for r_idx, row in enumerate(self.grid)
+                                for c_idx, tile in enumerate(row) if tile == floor]
+        return self.floor_tiles
+
+    def free_floor_tiles(self, avoid_npcs: bool, avoid_enemies: bool) -> List[Tuple[int, int]]:
+        """Get the unoccupied floor tiles in row-major order"""
+        # Bucket the occupants by tile once instead of checking every entity against every tile
+        occupied = self.occupied_tiles(avoid_npcs, avoid_enemies)
+        return [pos for pos in self.get_floor_tiles() if pos not in occupied]
+
+    def get_wall_rows(self) -> List[int]:
+        """Get each grid row as a bitmask with bit x set where tile x is a wall"""
+        if self.wall_rows is None:
+            # Translate the whole grid as one contiguous buffer, then parse each row's digits (column 0 lowest)
+            digits = b''.join(self.grid).translate(ROW_DIGIT_TABLES[WALL_TILE])
+            width = self.grid_width
+            self.wall_rows = [int(digits[start:start + width][::-1], 2) for start in range(0, len(digits), width)]
+        return self.wall_rows
+
+    def get_background(self) -> pygame.Surface:
+        """Get the room's tiles pre-rendered onto one surface, drawing them on first use"""
+        if self.background is None:
+            self.background = self.render_background()
+            self.dirty_chunks.clear()
+        elif self.dirty_chunks:
+            # Redraw just the chunks whose tiles changed
+            for chunk_x, chunk_y in self.dirty_chunks:
+                left, top = chunk_x * BACKGROUND_CHUNK_TILES, chunk_y * BACKGROUND_CHUNK_TILES
+                right = min(left + BACKGROUND_CHUNK_TILES, self.grid_width)
+                bottom = min(top + BACKGROUND_CHUNK_TILES, self.grid_height)
+                self.background.fill(BLACK, (left * TILE_SIZE, top * TILE_SIZE,
+                                             (right - left) * TILE_SIZE, (bottom - top) * TILE_SIZE))
+                self.draw_tiles(self.background, left, top, right, bottom)
+            self.dirty_chunks.clear()
+        return self.background
+
+    def render_background(self) -> pygame.Surface:
+        """Draw every tile of the room onto a new surface"""
+        background = pygame.Surface((self.grid_width * TILE_SIZE, self.grid_height * TILE_SIZE))
+        if pygame.display.get_surface() is not None:
+            background = background.convert()
+        self.draw_tiles(background, 0, 0, self.grid_width, self.grid_height)
+        return background
+
+    def draw_tiles(self, background: pygame.Surface, left: int, top: int, right: int, bottom: int):
+        """Draw the tiles in columns left..right-1 and rows top..bottom-1 onto a surface"""
+        tile_rect = pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE)  # Scratch rect moved to each tile in turn
+        for y in range(top, bottom):
+            for x in range(left, right):
+                tile_rect.update(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+                tile_type = self.grid[y][x]
+            
+                if tile_type == FLOOR_TILE:
+                    texture = resources.get_texture(self.floor_texture)
+                    if texture:
+                        background.blit(texture, tile_rect)
+                    else:
+                        background.fill(FLOOR_COLOR, tile_rect)
+                    
+                elif tile_type == WALL_TILE:
+                    texture = resources.get_texture(self.wall_texture)
+                    if texture:
+                        background.blit(texture, tile_rect)
+                    else:
+                        background.fill(WALL_COLOR, tile_rect)
+                    
+                elif tile_type == WATER_TILE:
+                    texture = resources.get_texture("water")
+                    if texture:
+                        background.blit(texture, tile_rect)
+                    else:
+                        background.fill(BLUE, tile_rect)
+                    
+                elif tile_type == CHEST_TILE:
+                    # Draw floor first
+                    floor_texture = resources.get_texture(self.floor_texture)
+                    if floor_texture:
+                        background.blit(floor_texture, tile_rect)
+                    else:
+                        background.fill(FLOOR_COLOR, tile_rect)
+                    # Draw chest on top
+                    chest_texture = resources.get_texture("chest")
+                    if chest_texture:
+                        background.blit(chest_texture, tile_rect)
+                    else:
+                        pygame.draw.rect(background, ADVENTURE_BROWN, tile_rect)
+                    
+                elif tile_type == EXIT_TILE:
+                    # Draw floor first
+                    floor_texture = resources.get_texture(self.floor_texture)
+                    if floor_texture:
+                        background.blit(floor_texture, tile_rect)
+                    else:
+                        background.fill(FLOOR_COLOR, tile_rect)
+                    # Draw exit indicator
+                    pygame.draw.rect(background, QUEST_COLOR, tile_rect, 3)
+
+    def invalidate_grid_caches(self):
+        """Drop the cached wall bitmasks, floor tiles and background after the grid has been edited"""
+        self.wall_rows = None
+        self.floor_tiles = None
+        self.background = None
+
+    def invalidate_tiles(self, left: int, top: int, right: int, bottom: int):
+        """Mark the tiles in an inclusive tile-coordinate box as edited"""
+        self.wall_rows = None
+        self.floor_tiles = None
+        if self.background is None:
+            return  # Nothing drawn yet; the first get_background draws everything
+        
+        first_x, last_x = max(0, left), min(right, self.grid_width - 1)
+        first_y, last_y = max(0, top), min(bottom, self.grid_height - 1)
+        for chunk_y in range(first_y // BACKGROUND_CHUNK_TILES, last_y // BACKGROUND_CHUNK_TILES + 1):
+            for chunk_x in range(first_x // BACKGROUND_CHUNK_TILES, last_x // BACKGROUND_CHUNK_TILES + 1):
+                self.dirty_chunks.add((chunk_x, chunk_y))
+
+    def rect_hits_wall(self, rect: pygame.Rect) -> bool:
+        """Check whether a pixel rect touches any wall tile"""
+        left_tile = max(0, rect.left // TILE_SIZE)
+        right_tile = min(self.grid_width - 1, rect.right // TILE_SIZE)
+        if left_tile > right_tile:
+            return False
+        
+        # One AND per row covers every tile the rect spans horizontally
+        mask = ((1 << (right_tile - left_tile + 1)) - 1) << left_tile
+        wall_rows = self.get_wall_rows()
+        for y in range(max(0, rect.top // TILE_SIZE), min(self.grid_height, rect.bottom // TILE_SIZE + 1)):
+            if wall_rows[y] & mask:
+                return True
+        return False
+
     def to_dict(self):
         return {
             'name': self.name,
@@ -1801,10 +1965,10 @@ class Room:
             'grid_height': self.grid_height,
             'room_type': self.room_type,
             'difficulty_level': self.difficulty_level,
-            'grid': [[tile.value for tile in row] for row in self.grid],
+            'grid_data': base64.b64encode(b''.join(self.grid)).decode('ascii'),  # Rows of grid_width tile bytes
             'items': [item.to_dict() for item in self.items],
             'npcs': [npc.to_dict() for npc in self.npcs],
-            'enemies': [enemy.to_dict() for enemy in self.enemies],
+            'enemy_data': base64.b64encode(EnemyManager.pack(self.enemies)).decode('ascii'),
             'exits': self.exits,
             'visited': self.visited
         }
@@ -1813,16 +1977,111 @@ class Room:
     def from_dict(cls, data, name_override=None): # name_override for dynamic room creation
         room_name = name_override if name_override else data['name']
         room_type = data.get('room_type', 'cave')
-        room = cls(room_name, data['grid_width'], data['grid_height'], room_type)
-        room.grid = [[TileType(tile_val) for tile_val in row] for row in data['grid']]
+        room = cls(room_name, data['grid_width'], data['grid_height'], room_type, generate=False)
+        if 'grid_data' in data:
+            tiles = base64.b64decode(data['grid_data'])
+            width = data['grid_width']
+            room.grid = [bytearray(tiles[start:start + width]) for start in range(0, len(tiles), width)]
+        else:  # Saves from before the grid was packed
+            room.grid = [bytearray(row) for row in data['grid']]
+        room.invalidate_grid_caches()
         room.items = [Item.from_dict(item_data) for item_data in data.get('items', [])]
         room.npcs = [NPC.from_dict(npc_data) for npc_data in data.get('npcs', [])]
-        room.enemies = [Enemy.from_dict(enemy_data) for enemy_data in data.get('enemies', [])]
+        if 'enemy_data' in data:
+            room.enemies = EnemyManager.unpack(base64.b64decode(data['enemy_data']))
+        else:  # Saves from before enemies were packed
+            room.enemies = [Enemy.from_dict(enemy_data) for enemy_data in data.get('enemies', [])]
         room.exits = data.get('exits', {})
         room.visited = data.get('visited', False)
         room.difficulty_level = data.get('difficulty_level', 1)
         return room
 
+# Biome-specific feature generator per room type; other types use generate_generic_features
+ROOM_FEATURE_GENERATORS = {
+    "cave": Room.generate_cave_features,
+    "forest": Room.generate_forest_features,
+    "dungeon": Room.generate_dungeon_features,
+    "village": Room.generate_village_features,
+    "clearing": Room.generate_clearing_features,
+    "ruins": Room.generate_ruins_features,
+    "swamp": Room.generate_swamp_features,
+    "mountain": Room.generate_mountain_features,
+}
+
+# Room types that procedurally generated rooms are drawn from
+PROCEDURAL_ROOM_TYPES = ["cave", "forest", "dungeon", "village", "clearing", "ruins", "swamp", "mountain"]
+
+# Descriptive names for procedurally generated rooms: room type -> name choices
+ROOM_TYPE_NAMES = {
+    "cave": ["Echoing Cavern", "Crystal Grotto", "Deep Chamber", "Limestone Cave", "Hidden Hollow"],
+    "forest": ["Dense Woodland", "Mystic Grove", "Ancient Forest", "Enchanted Thicket", "Twilight Woods"],
+    "dungeon": ["Forgotten Crypt", "Stone Corridors", "Ancient Dungeon", "Dark Passages", "Lost Tomb"],
+    "village": ["Abandoned Village", "Rural Settlement", "Ghost Town", "Old Hamlet", "Desert Outpost"],
+    "clearing": ["Sunny Meadow", "Peaceful Glade", "Flower Field", "Open Plains", "Tranquil Grove"],
+    "ruins": ["Ancient Ruins", "Crumbling Temple", "Lost City", "Weathered Stones", "Forgotten Monument"],
+    "swamp": ["Murky Swamp", "Fetid Marsh", "Misty Bog", "Dark Wetlands", "Stagnant Pool"],
+    "mountain": ["Rocky Summit", "Windswept Peak", "Stone Plateau", "Alpine Pass", "Cliff Face"]
+}
+
+# Items that procedurally generated rooms can hold: room type -> [(name, description, type, base value)]
+PROCEDURAL_ITEMS = {
+    "cave": [
+        ("Crystal Shard", "A glowing crystal fragment", ItemType.TREASURE, 50),
+        ("Cave Mushroom", "Edible fungus that restores health", ItemType.CONSUMABLE, 0),
+        ("Stone Tablet", "Ancient writings on stone", ItemType.KEY_ITEM, 0),
+        ("Rare Mineral", "Valuable ore deposit", ItemType.TREASURE, 100)
+    ],
+    "forest": [
+        ("Healing Herb", "Natural medicine", ItemType.CONSUMABLE, 0),
+        ("Ancient Seed", "Mysterious plant seed", ItemType.KEY_ITEM, 0),
+        ("Wild Berry", "Sweet fruit that restores energy", ItemType.CONSUMABLE, 0),
+        ("Wooden Amulet", "Carved forest charm", ItemType.TREASURE, 75)
+    ],
+    "dungeon": [
+        ("Rusty Key", "Opens ancient locks", ItemType.KEY_ITEM, 0),
+        ("Gold Coin", "Old currency", ItemType.TREASURE, 25),
+        ("Scroll Fragment", "Piece of ancient knowledge", ItemType.KEY_ITEM, 0),
+        ("Jeweled Dagger", "Ornate weapon", ItemType.TREASURE, 200)
+    ],
+    "village": [
+        ("Trade Goods", "Valuable merchandise", ItemType.TREASURE, 150),
+        ("Village Map", "Shows local area", ItemType.KEY_ITEM, 0),
+        ("Rations", "Preserved food", ItemType.CONSUMABLE, 0),
+        ("Merchant's Ledger", "Trading records", ItemType.KEY_ITEM, 0)
+    ],
+    "ruins": [
+        ("Ancient Relic", "Mysterious artifact", ItemType.KEY_ITEM, 0),
+        ("Precious Gemstone", "Valuable jewel", ItemType.TREASURE, 300),
+        ("Runed Stone", "Magical inscription", ItemType.KEY_ITEM, 0),
+        ("Golden Idol", "Religious artifact", ItemType.TREASURE, 500)
+    ]
+}
+
+# NPCs that can appear in procedurally generated rooms: room type -> [(name, dialogue lines)]
+PROCEDURAL_NPCS = {
+    "cave": [
+        ("Cave Dweller", ["I've lived in these caves for years...", "The crystals sing at night.", "Beware the deeper chambers."]),
+        ("Lost Explorer", ["I've been lost for days!", "Do you know the way out?", "I found some interesting things here."]),
+        ("Crystal Miner", ["These crystals are valuable.", "I can trade for rare gems.", "Mining is dangerous work."])
+    ],
+    "forest": [
+        ("Forest Guardian", ["The trees whisper ancient secrets.", "Nature must be protected.", "You seem worthy of passage."]),
+        ("Wandering Druid", ["The forest spirits are restless.", "I can teach you about herbs.", "Balance must be maintained."]),
+        ("Lost Traveler", ["I've been walking for hours!", "These woods all look the same.", "Have you seen the main road?"])
+    ],
+    "village": [
+        ("Village Elder", ["Welcome to our humble settlement.", "We don't get many visitors.", "Times have been hard lately."]),
+        ("Local Merchant", ["I have goods for trade.", "Coin for quality items.", "Business has been slow."]),
+        ("Village Guard", ["Stay out of trouble here.", "We keep the peace.", "Move along, traveler."])
+    ],
+    "ruins": [
+        ("Archaeologist", ["These ruins are fascinating!", "I study ancient civilizations.", "Some artifacts are quite valuable."]),
+        ("Relic Hunter", ["I seek ancient treasures.", "Knowledge has its price.", "Some secrets are dangerous."]),
+        ("Ghost of the Past", ["I remember when this place lived...", "Long ago, this was magnificent.", "The past echoes in these stones."])
+    ]
+}
+
+
 class Game:
     def __init__(self):
         pygame.init()
@@ -1858,12 +2117,14 @@ class Game:
         
         # Procedural room generation tracking
         self.room_id_counter = 1000  # Start procedural rooms at 1000+
-        self.discovered_exits: Dict[str, Tuple[str, str]] = {}  # (room_name, direction) -> (target_room_name, target_direction)
+        self.discovered_exits: Dict[str, Dict[str, Tuple[str, str]]] = {}  # room_name -> direction -> (target_room_name, target_direction)
+        self.enemy_manager = EnemyManager()  # Batched per-frame enemy draw
         
         self.font_small = pygame.font.Font(FONT_NAME, FONT_SIZE_SMALL)
         self.font_medium = pygame.font.Font(FONT_NAME, FONT_SIZE_MEDIUM)
         self.font_large = pygame.font.Font(FONT_NAME, FONT_SIZE_LARGE)
         self.font_tiny = pygame.font.Font(FONT_NAME, FONT_SIZE_TINY)
+        self.text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, ...]], pygame.Surface] = {}
         
         self.input_text = ""
         self.dialogue_target_npc: Optional[NPC] = None
@@ -1892,14 +2153,11 @@ class Game:
 
     def load_settings(self) -> GameSettings:
         """Load settings from file or return defaults"""
-        if os.path.exists(SETTINGS_FILE):
-            try:
-                with open(SETTINGS_FILE, 'r') as f:
-                    settings_data = json.load(f)
-                return GameSettings.from_dict(settings_data)
-            except:
-                return GameSettings()
-        return GameSettings()
+        try:
+            with open(SETTINGS_FILE, 'r') as f:
+                return GameSettings.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return GameSettings()  # Missing, unreadable or malformed settings fall back to defaults
     
     def save_settings(self):
         """Save current settings to file"""
@@ -1944,26 +2202,14 @@ class Game:
     
     def generate_procedural_room(self, suggested_type: str = None) -> Room:
         """Generate a completely new procedural room"""
-        room_types = ["cave", "forest", "dungeon", "village", "clearing", "ruins", "swamp", "mountain"]
-        room_type = suggested_type if suggested_type else random.choice(room_types)
+        room_type = suggested_type if suggested_type else random.choice(PROCEDURAL_ROOM_TYPES)
         
         # Generate unique room name
         room_id = f"procedural_{self.room_id_counter}"
         self.room_id_counter += 1
         
         # Create descriptive names based on type
-        type_names = {
-            "cave": ["Echoing Cavern", "Crystal Grotto", "Deep Chamber", "Limestone Cave", "Hidden Hollow"],
-            "forest": ["Dense Woodland", "Mystic Grove", "Ancient Forest", "Enchanted Thicket", "Twilight Woods"],
-            "dungeon": ["Forgotten Crypt", "Stone Corridors", "Ancient Dungeon", "Dark Passages", "Lost Tomb"],
-            "village": ["Abandoned Village", "Rural Settlement", "Ghost Town", "Old Hamlet", "Desert Outpost"],
-            "clearing": ["Sunny Meadow", "Peaceful Glade", "Flower Field", "Open Plains", "Tranquil Grove"],
-            "ruins": ["Ancient Ruins", "Crumbling Temple", "Lost City", "Weathered Stones", "Forgotten Monument"],
-            "swamp": ["Murky Swamp", "Fetid Marsh", "Misty Bog", "Dark Wetlands", "Stagnant Pool"],
-            "mountain": ["Rocky Summit", "Windswept Peak", "Stone Plateau", "Alpine Pass", "Cliff Face"]
-        }
-        
-        room_name = f"{random.choice(type_names.get(room_type, ['Unknown Place']))} {room_id[-3:]}"
+        room_name = f"{random.choice(ROOM_TYPE_NAMES.get(room_type, ['Unknown Place']))} {room_id[-3:]}"
         
         # Create room with enhanced difficulty based on distance from start
         difficulty = min(10, 1 + (self.room_id_counter - 1000) // 5)
@@ -1986,44 +2232,9 @@ class Game:
         """Add procedural items to a room based on type and difficulty"""
         num_items = random.randint(1, min(5, 2 + difficulty // 2))
         
-        type_items = {
-            "cave": [
-                ("Crystal Shard", "A glowing crystal fragment", ItemType.TREASURE, 50),
-                ("Cave Mushroom", "Edible fungus that restores health", ItemType.CONSUMABLE, 0),
-                ("Stone Tablet", "Ancient writings on stone", ItemType.KEY_ITEM, 0),
-                ("Rare Mineral", "Valuable ore deposit", ItemType.TREASURE, 100)
-            ],
-            "forest": [
-                ("Healing Herb", "Natural medicine", ItemType.CONSUMABLE, 0),
-                ("Ancient Seed", "Mysterious plant seed", ItemType.KEY_ITEM, 0),
-                ("Wild Berry", "Sweet fruit that restores energy", ItemType.CONSUMABLE, 0),
-                ("Wooden Amulet", "Carved forest charm", ItemType.TREASURE, 75)
-            ],
-            "dungeon": [
-                ("Rusty Key", "Opens ancient locks", ItemType.KEY_ITEM, 0),
-                ("Gold Coin", "Old currency", ItemType.TREASURE, 25),
-                ("Scroll Fragment", "Piece of ancient knowledge", ItemType.KEY_ITEM, 0),
-                ("Jeweled Dagger", "Ornate weapon", ItemType.TREASURE, 200)
-            ],
-            "village": [
-                ("Trade Goods", "Valuable merchandise", ItemType.TREASURE, 150),
-                ("Village Map", "Shows local area", ItemType.KEY_ITEM, 0),
-                ("Rations", "Preserved food", ItemType.CONSUMABLE, 0),
-                ("Merchant's Ledger", "Trading records", ItemType.KEY_ITEM, 0)
-            ],
-            "ruins": [
-                ("Ancient Relic", "Mysterious artifact", ItemType.KEY_ITEM, 0),
-                ("Precious Gemstone", "Valuable jewel", ItemType.TREASURE, 300),
-                ("Runed Stone", "Magical inscription", ItemType.KEY_ITEM, 0),
-                ("Golden Idol", "Religious artifact", ItemType.TREASURE, 500)
-            ]
-        }
-        
-        available_items = type_items.get(room_type, type_items["cave"])
+        available_items = PROCEDURAL_ITEMS.get(room_type, PROCEDURAL_ITEMS["cave"])
         
-        for _ in range(num_items):
-            item_data = random.choice(available_items)
-            name, description, item_type, base_value = item_data
+        for name, description, item_type, base_value in random.choices(available_items, k=num_items):
             
             # Scale value with difficulty
             value = base_value + (difficulty * 10)
@@ -2034,30 +2245,7 @@ class Game:
     
     def add_procedural_npc(self, room: Room, room_type: str):
         """Add a procedural NPC to a room"""
-        type_npcs = {
-            "cave": [
-                ("Cave Dweller", ["I've lived in these caves for years...", "The crystals sing at night.", "Beware the deeper chambers."]),
-                ("Lost Explorer", ["I've been lost for days!", "Do you know the way out?", "I found some interesting things here."]),
-                ("Crystal Miner", ["These crystals are valuable.", "I can trade for rare gems.", "Mining is dangerous work."])
-            ],
-            "forest": [
-                ("Forest Guardian", ["The trees whisper ancient secrets.", "Nature must be protected.", "You seem worthy of passage."]),
-                ("Wandering Druid", ["The forest spirits are restless.", "I can teach you about herbs.", "Balance must be maintained."]),
-                ("Lost Traveler", ["I've been walking for hours!", "These woods all look the same.", "Have you seen the main road?"])
-            ],
-            "village": [
-                ("Village Elder", ["Welcome to our humble settlement.", "We don't get many visitors.", "Times have been hard lately."]),
-                ("Local Merchant", ["I have goods for trade.", "Coin for quality items.", "Business has been slow."]),
-                ("Village Guard", ["Stay out of trouble here.", "We keep the peace.", "Move along, traveler."])
-            ],
-            "ruins": [
-                ("Archaeologist", ["These ruins are fascinating!", "I study ancient civilizations.", "Some artifacts are quite valuable."]),
-                ("Relic Hunter", ["I seek ancient treasures.", "Knowledge has its price.", "Some secrets are dangerous."]),
-                ("Ghost of the Past", ["I remember when this place lived...", "Long ago, this was magnificent.", "The past echoes in these stones."])
-            ]
-        }
-        
-        available_npcs = type_npcs.get(room_type, type_npcs["cave"])
+        available_npcs = PROCEDURAL_NPCS.get(room_type, PROCEDURAL_NPCS["cave"])
         npc_data = random.choice(available_npcs)
         name, dialogue = npc_data
         
@@ -2065,16 +2253,16 @@ class Game:
         personality = random.choice(list(NPCPersonality))
         mood = random.choice(list(NPCMood))
         
-        npc = NPC(name, pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE), dialogue, 
+        npc = NPC(name, pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE), list(dialogue), 
                   personality=personality, current_mood=mood)
         room.add_npc(npc)
     
     def discover_new_room(self, from_room: str, direction: str) -> str:
         """Discover or generate a new room in the given direction"""
         # Check if we already have a room connection for this direction
-        connection_key = (from_room, direction)
-        if connection_key in self.discovered_exits:
-            target_room, _ = self.discovered_exits[connection_key]
+        room_exits = self.discovered_exits.setdefault(from_room, {})
+        if direction in room_exits:
+            target_room, _ = room_exits[direction]
             return target_room
         
         # Generate new room
@@ -2086,35 +2274,22 @@ class Game:
         self.rooms[new_room.name] = new_room
         
         # Set up bidirectional connections
-        opposite_directions = {"north": "south", "south": "north", "east": "west", "west": "east"}
-        opposite_dir = opposite_directions[direction]
+        opposite_dir = OPPOSITE_DIRECTIONS[direction]
         
         # Connect from current room to new room
-        if direction == "north":
-            entry_x, entry_y = GRID_WIDTH // 2, GRID_HEIGHT - 2
-            exit_x, exit_y = GRID_WIDTH // 2, 0
-        elif direction == "south":
-            entry_x, entry_y = GRID_WIDTH // 2, 1
-            exit_x, exit_y = GRID_WIDTH // 2, GRID_HEIGHT - 1
-        elif direction == "east":
-            entry_x, entry_y = 1, GRID_HEIGHT // 2
-            exit_x, exit_y = GRID_WIDTH - 1, GRID_HEIGHT // 2
-        elif direction == "west":
-            entry_x, entry_y = GRID_WIDTH - 2, GRID_HEIGHT // 2
-            exit_x, exit_y = 0, GRID_HEIGHT // 2
+        (entry_x, entry_y), (exit_x, exit_y) = EXIT_COORDS[direction]
         
         # Set up exits
         current_room.exits[direction] = (new_room.name, entry_x, entry_y)
         new_room.exits[opposite_dir] = (from_room, exit_x, exit_y)
         
         # Place exit tiles
-        self.place_exit_tile(current_room, direction, exit_y if direction in ["north", "south"] else GRID_HEIGHT // 2, 
-                           exit_x if direction in ["east", "west"] else GRID_WIDTH // 2)
+        self.place_exit_tile(current_room, direction, exit_y, exit_x)
         self.place_exit_tile(new_room, opposite_dir, entry_y, entry_x)
         
         # Store the connection for future reference
-        self.discovered_exits[connection_key] = (new_room.name, opposite_dir)
-        self.discovered_exits[(new_room.name, opposite_dir)] = (from_room, direction)
+        room_exits[direction] = (new_room.name, opposite_dir)
+        self.discovered_exits.setdefault(new_room.name, {})[opposite_dir] = (from_room, direction)
         
         return new_room.name
 
@@ -2137,8 +2312,9 @@ class Game:
         # Add water tiles for environmental variety
         for i in range(3):
             x, y = random.randint(2, GRID_WIDTH-3), random.randint(2, GRID_HEIGHT-3)
-            if crystal_chamber.grid[y][x] == TileType.FLOOR:
-                crystal_chamber.grid[y][x] = TileType.WATER
+            if crystal_chamber.grid[y][x] == FLOOR_TILE:
+                crystal_chamber.grid[y][x] = WATER_TILE
+                crystal_chamber.invalidate_tiles(x, y, x, y)
         
         # Create underground tunnels
         underground_tunnels = Room("Underground Tunnels", GRID_WIDTH, GRID_HEIGHT)
@@ -2151,8 +2327,9 @@ class Game:
         # Add treasure chests
         for i in range(2):
             x, y = random.randint(1, GRID_WIDTH-2), random.randint(1, GRID_HEIGHT-2)
-            if lost_city.grid[y][x] == TileType.FLOOR:
-                lost_city.grid[y][x] = TileType.CHEST
+            if lost_city.grid[y][x] == FLOOR_TILE:
+                lost_city.grid[y][x] = CHEST_TILE
+                lost_city.invalidate_tiles(x, y, x, y)
         
         # Create merchant area
         merchant_quarter = Room("Merchant Quarter", GRID_WIDTH, GRID_HEIGHT)
@@ -2228,27 +2405,20 @@ class Game:
         skeleton3 = Enemy(EnemyType.SKELETON, pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE), 20)
         bandit_camp.add_enemy(skeleton3)
 
-        self.rooms = {
-            "Mystic Cave Entrance": start_room,
-            "Crystal Chamber": crystal_chamber,
-            "Underground Tunnels": underground_tunnels,
-            "Lost City of Aethermoor": lost_city,
-            "Merchant Quarter": merchant_quarter,
-            "Bandit Camp": bandit_camp
-        }
+        # Key by each room's own (interned) name so lookups share the same string objects
+        self.rooms = {room.name: room for room in (start_room, crystal_chamber, underground_tunnels,
+                                                   lost_city, merchant_quarter, bandit_camp)}
 
     def place_exit_tile(self, room: Room, direction: str, tile_y: int, tile_x: int):
         """Place an exit tile at the specified coordinates in the room"""
         if (0 <= tile_x < room.grid_width and 0 <= tile_y < room.grid_height):
+            # Clear the 3x3 area around the exit, keeping any exits already there
+            left, right = max(0, tile_x - 1), min(room.grid_width, tile_x + 2)
+            for row in room.grid[max(0, tile_y - 1):tile_y + 2]:
+                row[left:right] = row[left:right].translate(EDGE_TILE_TABLE)
             # Force the tile to be an exit regardless of current type
-            room.grid[tile_y][tile_x] = TileType.EXIT
-            # Also ensure the area around the exit is clear
-            for dy in range(-1, 2):
-                for dx in range(-1, 2):
-                    check_x, check_y = tile_x + dx, tile_y + dy
-                    if (0 <= check_x < room.grid_width and 0 <= check_y < room.grid_height and
-                        room.grid[check_y][check_x] != TileType.EXIT):
-                        room.grid[check_y][check_x] = TileType.FLOOR
+            room.grid[tile_y][tile_x] = EXIT_TILE
+            room.invalidate_tiles(tile_x - 1, tile_y - 1, tile_x + 1, tile_y + 1)
 
     def transition_to_adjacent_room(self, direction: str):
         """Handle natural room transitions when player walks off screen edge"""
@@ -2270,7 +2440,7 @@ class Game:
             entry_x, entry_y = self.get_entry_position(direction)
             
         # Move player to new room at opposite edge
-        self.player.current_room = target_room
+        self.player.current_room = self.rooms[target_room].name  # The interned key, for per-frame lookups
         self.player.rect.centerx = entry_x * TILE_SIZE + TILE_SIZE // 2
         self.player.rect.centery = entry_y * TILE_SIZE + TILE_SIZE // 2
         
@@ -2279,34 +2449,32 @@ class Game:
     
     def check_quest_objectives(self, action_type: str, action_target: str):
         """Check if any quest objectives are completed by this action"""
-        if not self.player:
+        if not self.player or action_type not in QUEST_ACTION_TYPES:
             return
-            
+        
+        target = action_target.lower()
         for quest_id in self.player.active_quests:
             if quest_id in self.quests:
                 quest = self.quests[quest_id]
                 if quest.status == QuestStatus.ACTIVE:
-                    # Check each objective
+                    # Check each objective; simple pattern matching against the target name
+                    completed = quest.completed_objectives
+                    remaining = 0  # Objectives still open after this action
                     for i, objective in enumerate(quest.objectives):
-                        if not quest.completed_objectives[i]:
-                            # Simple pattern matching for objectives
-                            if action_type == "enter_room" and action_target.lower() in objective.lower():
-                                quest.completed_objectives[i] = True
-                                self.show_notification(f"Quest objective completed: {objective}", 3)
-                            elif action_type == "collect_item" and action_target.lower() in objective.lower():
-                                quest.completed_objectives[i] = True
-                                self.show_notification(f"Quest objective completed: {objective}", 3)
-                            elif action_type == "talk_to_npc" and action_target.lower() in objective.lower():
-                                quest.completed_objectives[i] = True
+                        if not completed[i]:
+                            if target in objective.lower():
+                                completed[i] = True
                                 self.show_notification(f"Quest objective completed: {objective}", 3)
+                            else:
+                                remaining += 1
                     
                     # Check if quest is complete
-                    if all(quest.completed_objectives):
+                    if not remaining:
                         quest.status = QuestStatus.COMPLETED
                         self.show_notification(f"Quest completed: {quest.title}", 4)
                         # Give rewards
                         for reward_item in quest.reward_items:
-                            self.player.inventory.append(Item(reward_item, f"Reward from {quest.title}", ItemType.TREASURE))
+                            self.player.add_item(Item(reward_item, f"Reward from {quest.title}", ItemType.TREASURE))
     
     def create_story_quests(self):
         """Create the main story quests"""
@@ -2360,8 +2528,10 @@ class Game:
         
         try:
             filename = f"savegame_slot_{slot}.json" if slot > 0 else SAVE_FILE
+            # json.dumps without indent runs the C encoder; json.dump always uses the pure-Python one
+            save_text = json.dumps(save_data, separators=(',', ':'))
             with open(filename, 'w') as f:
-                json.dump(save_data, f, indent=2)
+                f.write(save_text)
             self.show_notification(f"Game saved to slot {slot}!", 3)
         except Exception as e:
             print(f"Failed to save game: {e}")
@@ -2371,12 +2541,12 @@ class Game:
         """Load a saved game state"""
         try:
             filename = f"savegame_slot_{slot}.json" if slot > 0 else SAVE_FILE
-            if not os.path.exists(filename):
+            try:
+                with open(filename, 'r') as f:
+                    save_data = json.load(f)
+            except FileNotFoundError:
                 self.show_notification(f"No save file found in slot {slot}!", 2)
                 return False
-                
-            with open(filename, 'r') as f:
-                save_data = json.load(f)
             
             # Load player
             self.player = Player.from_dict(save_data['player'])
@@ -2406,16 +2576,9 @@ class Game:
     
     def get_entry_position(self, direction: str) -> Tuple[int, int]:
         """Get the entry position when entering a room from a specific direction"""
-        if direction == "north":
-            return (GRID_WIDTH // 2, GRID_HEIGHT - 2)  # Enter from bottom
-        elif direction == "south":
-            return (GRID_WIDTH // 2, 1)  # Enter from top
-        elif direction == "west":
-            return (GRID_WIDTH - 2, GRID_HEIGHT // 2)  # Enter from right
-        elif direction == "east":
-            return (1, GRID_HEIGHT // 2)  # Enter from left
-        else:
-            return (GRID_WIDTH // 2, GRID_HEIGHT // 2)  # Default to center
+        if direction in EXIT_COORDS:
+            return EXIT_COORDS[direction][0]  # Enter on the side facing the room just left
+        return (GRID_WIDTH // 2, GRID_HEIGHT // 2)  # Default to center
 
     def get_item_texture_name(self, item_name: str) -> str:
         """Map item names to texture file names"""
@@ -2482,16 +2645,7 @@ class Game:
             return False
         
         # Check wall tiles within the current room
-        left_tile = rect.left // TILE_SIZE
-        right_tile = rect.right // TILE_SIZE
-        top_tile = rect.top // TILE_SIZE
-        bottom_tile = rect.bottom // TILE_SIZE
-        
-        for y in range(max(0, top_tile), min(current_room.grid_height, bottom_tile + 1)):
-            for x in range(max(0, left_tile), min(current_room.grid_width, right_tile + 1)):
-                if current_room.grid[y][x] == TileType.WALL:
-                    return True
-        return False
+        return current_room.rect_hits_wall(rect)
 
     def update_player_movement(self, keys):
         """Update player movement based on input"""
@@ -2523,60 +2677,13 @@ class Game:
         # Clear screen
         self.screen.fill(BLACK)
         
-        # Draw room tiles
-        for y in range(current_room.grid_height):
-            for x in range(current_room.grid_width):
-                tile_rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                tile_type = current_room.grid[y][x]
-                
-                if tile_type == TileType.FLOOR:
-                    texture = resources.get_texture(current_room.floor_texture)
-                    if texture:
-                        self.screen.blit(texture, tile_rect)
-                    else:
-                        self.screen.fill(FLOOR_COLOR, tile_rect)
-                        
-                elif tile_type == TileType.WALL:
-                    texture = resources.get_texture(current_room.wall_texture)
-                    if texture:
-                        self.screen.blit(texture, tile_rect)
-                    else:
-                        self.screen.fill(WALL_COLOR, tile_rect)
-                        
-                elif tile_type == TileType.WATER:
-                    texture = resources.get_texture("water")
-                    if texture:
-                        self.screen.blit(texture, tile_rect)
-                    else:
-                        self.screen.fill(BLUE, tile_rect)
-                        
-                elif tile_type == TileType.CHEST:
-                    # Draw floor first
-                    floor_texture = resources.get_texture(current_room.floor_texture)
-                    if floor_texture:
-                        self.screen.blit(floor_texture, tile_rect)
-                    else:
-                        self.screen.fill(FLOOR_COLOR, tile_rect)
-                    # Draw chest on top
-                    chest_texture = resources.get_texture("chest")
-                    if chest_texture:
-                        self.screen.blit(chest_texture, tile_rect)
-                    else:
-                        pygame.draw.rect(self.screen, ADVENTURE_BROWN, tile_rect)
-                        
-                elif tile_type == TileType.EXIT:
-                    # Draw floor first
-                    floor_texture = resources.get_texture(current_room.floor_texture)
-                    if floor_texture:
-                        self.screen.blit(floor_texture, tile_rect)
-                    else:
-                        self.screen.fill(FLOOR_COLOR, tile_rect)
-                    # Draw exit indicator
-                    pygame.draw.rect(self.screen, QUEST_COLOR, tile_rect, 3)
+        # Draw room tiles from the room's pre-rendered background
+        self.screen.blit(current_room.get_background(), (0, 0))
         
         # Draw items with textures
+        item_rect = pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE)
         for item in current_room.items:
-            item_rect = pygame.Rect(item.x * TILE_SIZE, item.y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+            item_rect.update(item.x * TILE_SIZE, item.y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
             texture_name = self.get_item_texture_name(item.name)
             texture = resources.get_texture(texture_name)
             if texture:
@@ -2600,7 +2707,7 @@ class Game:
                                    (self.player.rect.centery - npc.rect.centery)**2)
                 if distance <= interaction_distance:
                     # Draw "Press SPACE to talk" indicator
-                    indicator_text = self.font_tiny.render("Press SPACE", True, WHITE)
+                    indicator_text = self.render_text(self.font_tiny, "Press SPACE", WHITE)
                     indicator_rect = indicator_text.get_rect()
                     indicator_rect.centerx = npc.rect.centerx
                     indicator_rect.bottom = npc.rect.top - 5
@@ -2612,9 +2719,8 @@ class Game:
                     
                     self.screen.blit(indicator_text, indicator_rect)
         
-        # Draw enemies (they have their own draw method)
-        for enemy in current_room.enemies:
-            enemy.draw(self.screen, resources.get_texture)
+        # Draw enemies
+        self.enemy_manager.draw_all(self.screen, current_room.enemies, resources.get_texture)
         
         # Draw player
         player_texture = resources.get_texture("player")
@@ -2649,25 +2755,25 @@ class Game:
                         (health_x, health_y, health_fill_width, health_bar_height))
         
         # Health text
-        health_text = self.font_small.render(f"HP: {self.player.health}/{self.player.max_health}", 
-                                           True, WHITE)
+        health_text = self.render_text(self.font_small, f"HP: {self.player.health}/{self.player.max_health}", 
+                                       WHITE)
         self.screen.blit(health_text, (health_x, health_y + health_bar_height + 5))
         
         # Player info
         info_y = health_y + health_bar_height + 30
-        level_text = self.font_small.render(f"Level: {self.player.level}", True, WHITE)
+        level_text = self.render_text(self.font_small, f"Level: {self.player.level}", WHITE)
         self.screen.blit(level_text, (health_x, info_y))
         
-        gold_text = self.font_small.render(f"Gold: {self.player.gold}", True, ADVENTURE_GOLD)
+        gold_text = self.render_text(self.font_small, f"Gold: {self.player.gold}", ADVENTURE_GOLD)
         self.screen.blit(gold_text, (health_x, info_y + 25))
         
         # Current room
-        room_text = self.font_small.render(f"Room: {self.player.current_room}", True, WHITE)
+        room_text = self.render_text(self.font_small, f"Room: {self.player.current_room}", WHITE)
         self.screen.blit(room_text, (health_x, info_y + 50))
         
         # Show notification
         if self.notification_timer > 0:
-            notification_surface = self.font_medium.render(self.notification_text, True, WHITE)
+            notification_surface = self.render_text(self.font_medium, self.notification_text, WHITE)
             notification_rect = notification_surface.get_rect()
             notification_rect.centerx = SCREEN_WIDTH // 2
             notification_rect.y = 50
@@ -2680,6 +2786,16 @@ class Game:
             self.screen.blit(notification_surface, notification_rect)
             self.notification_timer -= 1
 
+    def render_text(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """Render antialiased text, reusing the surface from earlier frames when possible"""
+        key = (font, text, tuple(color))  # tuple() so unhashable pygame.Color values work as keys
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= TEXT_CACHE_SIZE:
+                del self.text_cache[next(iter(self.text_cache))]  # Drop the oldest entry
+            surface = self.text_cache[key] = font.render(text, True, color)
+        return surface
+
     def show_notification(self, text: str, duration_seconds: float):
         """Show a notification message"""
         self.notification_text = text
@@ -2691,14 +2807,13 @@ class Game:
             return
             
         current_room = self.rooms[self.player.current_room]
-        interaction_distance = TILE_SIZE + 10  # Allow some buffer distance
+        interaction_distance_sq = (TILE_SIZE + 10) ** 2  # Allow some buffer distance; squared to skip sqrt
         
         # Find nearby NPCs
+        player_x, player_y = self.player.rect.center
         for npc in current_room.npcs:
-            distance = math.sqrt((self.player.rect.centerx - npc.rect.centerx)**2 + 
-                               (self.player.rect.centery - npc.rect.centery)**2)
-            
-            if distance <= interaction_distance:
+            npc_x, npc_y = npc.rect.center
+            if (player_x - npc_x) ** 2 + (player_y - npc_y) ** 2 <= interaction_distance_sq:
                 self.start_dialogue_with_npc(npc)
                 return
         
@@ -2755,7 +2870,7 @@ class Game:
             pygame.draw.rect(self.screen, UI_BORDER_COLOR, dialogue_box, 3)
             
             # NPC name
-            name_text = self.font_medium.render(self.dialogue_target_npc.name, True, WHITE)
+            name_text = self.render_text(self.font_medium, self.dialogue_target_npc.name, WHITE)
             self.screen.blit(name_text, (dialogue_box.x + 10, dialogue_box.y + 10))
             
             # Dialogue text (word wrapped)
@@ -2764,7 +2879,7 @@ class Game:
             self.draw_wrapped_text(self.dialogue_text, text_area, self.font_small, WHITE)
             
             # Instructions
-            instruction_text = self.font_tiny.render("Press SPACE or ENTER to continue", True, LIGHT_GRAY)
+            instruction_text = self.render_text(self.font_tiny, "Press SPACE or ENTER to continue", LIGHT_GRAY)
             instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 80))
             self.screen.blit(instruction_text, instruction_rect)
             
@@ -2778,7 +2893,7 @@ class Game:
                     rel_text = f"Relationship: {rel_level}"
                     rel_color = RED
                 
-                rel_surface = self.font_tiny.render(rel_text, True, rel_color)
+                rel_surface = self.render_text(self.font_tiny, rel_text, rel_color)
                 self.screen.blit(rel_surface, (dialogue_box.x + 10, dialogue_box.y + dialogue_box.height - 30))
     
     def draw_wrapped_text(self, text: str, rect: pygame.Rect, font: pygame.font.Font, color: tuple):
@@ -2807,7 +2922,7 @@ class Game:
             if y_offset + font.get_height() > rect.height:
                 break  # Don't draw outside the rect
             
-            line_surface = font.render(line, True, color)
+            line_surface = self.render_text(font, line, color)
             self.screen.blit(line_surface, (rect.x, rect.y + y_offset))
             y_offset += font.get_height() + 2
 
@@ -2828,12 +2943,12 @@ class Game:
             self.screen.blit(s, (x, y))
         
         # Main title
-        title_text = self.font_large.render("Procedural Adventure", True, QUEST_COLOR)
+        title_text = self.render_text(self.font_large, "Procedural Adventure", QUEST_COLOR)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 120))
         self.screen.blit(title_text, title_rect)
         
         # Subtitle
-        subtitle_text = self.font_medium.render("Explore Infinite Dungeons & Mysteries", True, WHITE)
+        subtitle_text = self.render_text(self.font_medium, "Explore Infinite Dungeons & Mysteries", WHITE)
         subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 70))
         self.screen.blit(subtitle_text, subtitle_rect)
         
@@ -2849,7 +2964,7 @@ class Game:
         pygame.draw.rect(self.screen, QUEST_COLOR, tooltip_rect, 2)
         
         # Quest tooltip title
-        quest_title = self.font_medium.render("Your Quest Awaits", True, QUEST_COLOR)
+        quest_title = self.render_text(self.font_medium, "Your Quest Awaits", QUEST_COLOR)
         quest_title_rect = quest_title.get_rect(center=(SCREEN_WIDTH//2, tooltip_y + 25))
         self.screen.blit(quest_title, quest_title_rect)
         
@@ -2862,16 +2977,16 @@ class Game:
         ]
         
         for i, line in enumerate(quest_lines):
-            line_text = self.font_small.render(line, True, WHITE)
+            line_text = self.render_text(self.font_small, line, WHITE)
             line_rect = line_text.get_rect(center=(SCREEN_WIDTH//2, tooltip_y + 55 + i * 20))
             self.screen.blit(line_text, line_rect)
         
         # Start instructions
-        start_text = self.font_medium.render("Press ENTER or SPACE to Begin", True, WHITE)
+        start_text = self.render_text(self.font_medium, "Press ENTER or SPACE to Begin", WHITE)
         start_rect = start_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 160))
         self.screen.blit(start_text, start_rect)
         
         # Exit instructions
-        exit_text = self.font_small.render("Press ESC to Exit", True, LIGHT_GRAY)
+        exit_text = self.render_text(self.font_small, "Press ESC to Exit", LIGHT_GRAY)
         exit_rect = exit_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 190))
         self.screen.blit(exit_text, exit_rect)
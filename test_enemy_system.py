@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test script for the enemy system
+"""
+import pygame
+import sys
+import os
+
+# Add the current directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from enemies import Enemy, EnemyType, EnemyBehavior, EnemyManager
+
+def test_lurker_aggro():
+    """Test that only lurking enemies within aggro range turn aggressive"""
+    print("=== Testing Lurker Aggro ===")
+
+    pygame.init()
+
+    player_rect = pygame.Rect(400, 400, 32, 32)
+    close = Enemy(EnemyType.SPIDER, pygame.Rect(450, 400, 32, 32))
+    distant = Enemy(EnemyType.SPIDER, pygame.Rect(900, 400, 32, 32))
+    assert close.behavior == EnemyBehavior.LURK
+
+    for enemy in (close, distant):
+        enemy.update_behavior(player_rect)
+
+    print(f"Close spider: {close.behavior.name}, distant spider: {distant.behavior.name}")
+    assert close.behavior == EnemyBehavior.AGGRESSIVE
+    assert distant.behavior == EnemyBehavior.LURK
+
+    print("✓ Lurker aggro is working!")
+
+def test_axis_aligned_chase():
+    """Test that a slow chaser closes in along an axis at distances prone to rounding"""
+    print("\n=== Testing Axis-Aligned Chase ===")
+
+    player_rect = pygame.Rect(0, 0, 32, 32)
+    for distance in (49, 98, 103, 253):
+        slime = Enemy(EnemyType.SLIME, pygame.Rect(distance, 0, 32, 32))
+        slime.behavior = EnemyBehavior.AGGRESSIVE
+        for _ in range(5):
+            slime.update_movement(player_rect, lambda rect: False)
+        print(f"Slime starting {distance}px away is now at x={slime.rect.x}")
+        assert slime.rect.x == distance - 5 * slime.speed
+
+    print("✓ Chasing enemies close in every frame!")
+
+def test_enemy_pack_roundtrip():
+    """Test that packed enemy batches load back with the same state"""
+    print("\n=== Testing Enemy Packing ===")
+
+    enemies = [
+        Enemy(EnemyType.GOBLIN, pygame.Rect(-20, 40, 32, 32), health=15),
+        Enemy(EnemyType.BAT, pygame.Rect(700, 500, 24, 24)),
+    ]
+    enemies[0].take_damage(4)
+    enemies[1].behavior = EnemyBehavior.FLEE
+
+    blob = EnemyManager.pack(enemies)
+    loaded = EnemyManager.unpack(blob)
+    print(f"Packed {len(enemies)} enemies into {len(blob)} bytes")
+    assert [enemy.to_dict() for enemy in loaded] == [enemy.to_dict() for enemy in enemies]
+    assert EnemyManager.unpack(EnemyManager.pack([])) == []
+
+    print("✓ Enemy packing round-trips!")
+
+if __name__ == "__main__":
+    try:
+        test_lurker_aggro()
+        test_axis_aligned_chase()
+        test_enemy_pack_roundtrip()
+        print("\n🎉 ALL TESTS PASSED! The enemy system is working correctly! 🎉")
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+    pygame.quit()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script for room saving and loading
+"""
+import pygame
+import random
+import sys
+import os
+
+# Add the current directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main import Room, Item, ItemType, GRID_WIDTH, GRID_HEIGHT
+
+def test_room_roundtrip():
+    """Test that a saved room loads back with the same tiles and contents"""
+    print("=== Testing Room Save/Load ===")
+
+    pygame.init()
+    random.seed(5)
+
+    room = Room("Test Cave", GRID_WIDTH, GRID_HEIGHT, "swamp")
+    room.add_item(Item("Rope", "Sturdy hemp rope.", ItemType.KEY_ITEM))
+    data = room.to_dict()
+    print(f"Packed {GRID_WIDTH}x{GRID_HEIGHT} grid into {len(data['grid_data'])} characters")
+
+    loaded = Room.from_dict(data)
+    assert loaded.grid == room.grid
+    assert [(item.x, item.y) for item in loaded.items] == [(item.x, item.y) for item in room.items]
+    assert loaded.room_type == room.room_type
+
+    print("✓ Room round-trips through to_dict/from_dict!")
+
+def test_legacy_grid_load():
+    """Test that saves with the old nested-list grid still load"""
+    print("\n=== Testing Legacy Grid Load ===")
+
+    room = Room("Old Save", GRID_WIDTH, GRID_HEIGHT, "cave")
+    data = room.to_dict()
+    del data['grid_data']
+    data['grid'] = [list(row) for row in room.grid]
+
+    loaded = Room.from_dict(data)
+    assert loaded.grid == room.grid
+
+    print("✓ Legacy grids load correctly!")
+
+if __name__ == "__main__":
+    try:
+        test_room_roundtrip()
+        test_legacy_grid_load()
+        print("\n🎉 ALL TESTS PASSED! Room saving is working correctly! 🎉")
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+    pygame.quit()